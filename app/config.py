@@ -5,12 +5,33 @@ All secrets and tunables come from .env; no hardcoded credentials.
 """
 
 import os
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
 
 from dotenv import load_dotenv
 
 _BASE = Path(__file__).resolve().parent.parent
-load_dotenv(_BASE / ".env")
+_LOADED = False
+
+
+def load_env() -> None:
+    """Load .env from the project root once per process; later calls no-op.
+
+    Entry points and tests rely on this instead of calling load_dotenv.
+    _ENV_LOADED is exported so child processes (uvicorn reload/workers), which
+    inherit the already-loaded environment, skip parsing .env again.
+    """
+    global _LOADED
+    if _LOADED or os.getenv("_ENV_LOADED"):
+        _LOADED = True
+        return
+    load_dotenv(_BASE / ".env")
+    os.environ["_ENV_LOADED"] = "1"
+    _LOADED = True
+
+
+load_env()
 
 BASE_DIR: Path = _BASE
 
@@ -19,15 +40,44 @@ OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
 DEEPSEEK_API_KEY: str = os.getenv("DEEPSEEK_API_KEY", "")
 GOOGLE_API_KEY: str = os.getenv("GOOGLE_API_KEY", "")
 
+
+@dataclass(frozen=True)
+class Settings:
+    """Provider API keys, read once at import; use ``settings``."""
+
+    openai_api_key: str
+    deepseek_api_key: str
+    google_api_key: str
+
+
+settings = Settings(
+    openai_api_key=OPENAI_API_KEY,
+    deepseek_api_key=DEEPSEEK_API_KEY,
+    google_api_key=GOOGLE_API_KEY,
+)
+
 # Server
 APP_HOST: str = os.getenv("APP_HOST", "0.0.0.0")
 APP_PORT: int = int(os.getenv("APP_PORT", "8000"))
 DEBUG: bool = os.getenv("DEBUG", "false").lower() in ("true", "1", "yes")
+# uvicorn worker processes; ignored when DEBUG enables auto-reload
+APP_WORKERS: int = int(os.getenv("APP_WORKERS", "1"))
+# Open provider connections at startup so the first request is not cold
+PROVIDER_WARMUP: bool = os.getenv("PROVIDER_WARMUP", "true").lower() in (
+    "true",
+    "1",
+    "yes",
+)
+# Startup gives up on warm-up after this many seconds; a hung provider must
+# not keep the server from accepting requests
+PROVIDER_WARMUP_TIMEOUT: float = float(os.getenv("PROVIDER_WARMUP_TIMEOUT", "10"))
 
 # Defaults for API request parsing
 DEFAULT_MAX_LENGTH: int = 1000
 MIN_WORD_COUNT: int = 50
 MAX_WORD_COUNT: int = 5000
+# Most articles one /generate-batch request may ask for
+MAX_BATCH_SIZE: int = int(os.getenv("MAX_BATCH_SIZE", "10"))
 
 # Pipeline: LLM model names and endpoints (override via env if needed)
 GEMINI_EDIT_MODEL: str = os.getenv("GEMINI_EDIT_MODEL", "gemini-2.0-flash")
@@ -37,6 +87,44 @@ GEMINI_FALLBACK_MODEL: str = os.getenv(
 DEEPSEEK_BASE_URL: str = os.getenv(
     "DEEPSEEK_BASE_URL", "https://api.deepseek.com/v1/chat/completions"
 )
+# DeepSeek HTTP client: "httpx" (default) or "aiohttp" (pip install aiohttp)
+DEEPSEEK_HTTP_BACKEND: str = os.getenv("DEEPSEEK_HTTP_BACKEND", "httpx").lower()
+# Max concurrent calls per LLM provider across all pipeline runs
+LLM_MAX_CONCURRENCY: int = int(os.getenv("LLM_MAX_CONCURRENCY", "10"))
+# Per-provider overrides; size each to that provider's rate limit
+DEEPSEEK_MAX_CONC: int = int(os.getenv("DEEPSEEK_MAX_CONC", str(LLM_MAX_CONCURRENCY)))
+OPENAI_MAX_CONC: int = int(os.getenv("OPENAI_MAX_CONC", str(LLM_MAX_CONCURRENCY)))
+GEMINI_MAX_CONC: int = int(os.getenv("GEMINI_MAX_CONC", str(LLM_MAX_CONCURRENCY)))
+
+# Provider HTTP/2 connection pools (DeepSeek, OpenAI)
+HTTP_MAX_CONNECTIONS: int = int(os.getenv("HTTP_MAX_CONNECTIONS", "1000"))
+HTTP_MAX_KEEPALIVE_CONNECTIONS: int = int(
+    os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "100")
+)
+HTTP_KEEPALIVE_EXPIRY: float = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30"))
+# Articles up to this many words research + draft in one OpenAI call (0 = off)
+FUSED_RESEARCH_MAX_WORDS: int = int(os.getenv("FUSED_RESEARCH_MAX_WORDS", "0"))
+# Research text fed into the draft prompt is cut to this many tokens
+DRAFT_MAX_INPUT_TOKENS: int = int(os.getenv("DRAFT_MAX_INPUT_TOKENS", "3000"))
+# Edit draft paragraphs while the rest of the draft is still streaming
+DRAFT_EDIT_OVERLAP: bool = os.getenv("DRAFT_EDIT_OVERLAP", "False").lower() in (
+    "true",
+    "1",
+    "yes",
+)
+
+# LLM response cache: "memory" (default), "redis", or "none"
+LLM_CACHE_BACKEND: str = os.getenv("LLM_CACHE_BACKEND", "memory").lower()
+LLM_CACHE_TTL: int = int(os.getenv("LLM_CACHE_TTL", "3600"))
+LLM_CACHE_MAXSIZE: int = int(os.getenv("LLM_CACHE_MAXSIZE", "1024"))
+REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+# Seed sent to OpenAI so its temperature > 0 responses become cacheable
+_llm_seed = os.getenv("LLM_SEED", "")
+LLM_SEED: Optional[int] = int(_llm_seed) if _llm_seed else None
+# Stage result cache (research/draft/edit keyed on their inputs); CACHE_DIR
+# persists it on disk via diskcache, otherwise it lives in memory
+STAGE_CACHE: bool = os.getenv("STAGE_CACHE", "True").lower() in ("true", "1", "yes")
+CACHE_DIR: str = os.getenv("CACHE_DIR", "")
 
 # Frontend asset paths
 STATIC_DIR: Path = BASE_DIR / "frontend" / "static"
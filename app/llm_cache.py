@@ -0,0 +1,141 @@
+"""
+LLM response cache keyed on a canonical hash of the provider request.
+
+Identical (model, messages, temperature, extra) requests map to the same
+sha256 key, so repeated topics and UI "regenerate" testing skip the network
+round trip. Backends: in-process TTL/LRU (default) or Redis.
+
+Whole stage results use a separate cache keyed by ``stage_cache_key``, in
+memory or on disk under CACHE_DIR.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from typing import Any, Dict, List, Optional, Protocol
+
+from cachetools import TTLCache
+
+from app.config import (
+    CACHE_DIR,
+    LLM_CACHE_BACKEND,
+    LLM_CACHE_MAXSIZE,
+    LLM_CACHE_TTL,
+    REDIS_URL,
+    STAGE_CACHE,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class LLMCache(Protocol):
+    """Async key/value store for completed LLM responses."""
+
+    async def get(self, key: str) -> Optional[str]: ...
+
+    async def set(self, key: str, value: str) -> None: ...
+
+
+def cache_key(
+    model: str,
+    messages: List[Dict[str, str]],
+    temperature: float,
+    extra: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Return a deterministic sha256 hex key for an LLM request."""
+    payload = {
+        "model": model,
+        "messages": messages,
+        "temperature": temperature,
+        "extra": extra or {},
+    }
+    raw = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def stage_cache_key(
+    stage: str, model: str, prompt_version: str, inputs: Dict[str, Any]
+) -> str:
+    """Return a blake2b key for a stage result from its name, model and inputs."""
+    raw = json.dumps(inputs, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    return f"{stage}:{model}:{prompt_version}:{digest}"
+
+
+def is_cacheable(temperature: float, seed: Optional[int]) -> bool:
+    """Sampled responses (temperature > 0) are only reused when a seed is pinned."""
+    return temperature <= 0 or seed is not None
+
+
+class InMemoryLRU:
+    """Process-local TTL + LRU cache."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600) -> None:
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def get(self, key: str) -> Optional[str]:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: str) -> None:
+        self._cache[key] = value
+
+
+class RedisCache:
+    """Redis-backed cache shared across workers (requires the redis package)."""
+
+    def __init__(self, url: str, ttl: float = 3600, prefix: str = "llm:") -> None:
+        import redis.asyncio as redis
+
+        self._redis = redis.from_url(url, decode_responses=True)
+        self._ttl = int(ttl)
+        self._prefix = prefix
+
+    async def get(self, key: str) -> Optional[str]:
+        return await self._redis.get(self._prefix + key)
+
+    async def set(self, key: str, value: str) -> None:
+        await self._redis.set(self._prefix + key, value, ex=self._ttl)
+
+
+class DiskCache:
+    """On-disk cache that survives restarts (requires the diskcache package)."""
+
+    def __init__(self, directory: str, ttl: float = 3600) -> None:
+        import diskcache
+
+        self._cache = diskcache.Cache(directory)
+        self._ttl = ttl
+
+    async def get(self, key: str) -> Optional[str]:
+        return await asyncio.to_thread(self._cache.get, key)
+
+    async def set(self, key: str, value: str) -> None:
+        await asyncio.to_thread(self._cache.set, key, value, expire=self._ttl)
+
+
+def create_llm_cache() -> Optional[LLMCache]:
+    """Build the cache backend selected by LLM_CACHE_BACKEND (None if disabled)."""
+    backend = LLM_CACHE_BACKEND
+    if backend in ("", "none", "off"):
+        return None
+    if backend == "redis":
+        try:
+            return RedisCache(REDIS_URL, ttl=LLM_CACHE_TTL)
+        except ImportError:
+            logger.warning("redis package not installed - using in-memory LLM cache")
+    elif backend != "memory":
+        logger.warning("Unknown LLM_CACHE_BACKEND %r - using in-memory", backend)
+    return InMemoryLRU(maxsize=LLM_CACHE_MAXSIZE, ttl=LLM_CACHE_TTL)
+
+
+def create_stage_cache() -> Optional[LLMCache]:
+    """Build the stage result cache: on disk if CACHE_DIR is set, else in memory."""
+    if not STAGE_CACHE:
+        return None
+    if CACHE_DIR:
+        try:
+            return DiskCache(CACHE_DIR, ttl=LLM_CACHE_TTL)
+        except ImportError:
+            logger.warning("diskcache package not installed - using in-memory cache")
+    return InMemoryLRU(maxsize=LLM_CACHE_MAXSIZE, ttl=LLM_CACHE_TTL)
@@ -11,12 +11,14 @@ _root = os.path.dirname(_app_dir)
 if _root not in sys.path:
     sys.path.insert(0, _root)
 
+import asyncio
 import logging
 import time
-from typing import Any, Dict
+from typing import Any, AsyncIterator, Awaitable, Dict, List, Literal, Optional, TypeVar
 
-from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import HTMLResponse
+import orjson
+from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.responses import HTMLResponse, ORJSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel
@@ -24,12 +26,16 @@ from pydantic import BaseModel
 from app.config import (
     APP_HOST,
     APP_PORT,
+    APP_WORKERS,
     DEBUG,
     DEFAULT_MAX_LENGTH,
+    MAX_BATCH_SIZE,
+    PROVIDER_WARMUP,
+    PROVIDER_WARMUP_TIMEOUT,
     STATIC_DIR,
     TEMPLATES_DIR,
 )
-from app.pipeline import NewspaperPipeline
+from app.pipeline import NewspaperPipeline, aclose_shared_clients
 
 logging.basicConfig(
     level=logging.INFO,
@@ -41,12 +47,68 @@ app = FastAPI(
     title="AI Newspaper Agent",
     description="Automated journalism through sequential LLM orchestration",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
 templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
 
+# One pipeline per process, shared by every request through get_pipeline.
 pipeline = NewspaperPipeline()
+app.state.pipeline = pipeline
+
+
+def get_pipeline(request: Request) -> NewspaperPipeline:
+    """FastAPI dependency returning the app's shared pipeline."""
+    return request.app.state.pipeline
+
+
+@app.on_event("startup")
+async def _warmup() -> None:
+    """Pre-open provider connections so the first request skips DNS + TLS.
+
+    Bounded by PROVIDER_WARMUP_TIMEOUT so a hung provider cannot block startup.
+    """
+    if not PROVIDER_WARMUP:
+        return
+    try:
+        await asyncio.wait_for(
+            app.state.pipeline.warmup(), timeout=PROVIDER_WARMUP_TIMEOUT
+        )
+    except asyncio.TimeoutError:
+        logger.warning(
+            "Provider warm-up timed out after %.0fs; starting anyway",
+            PROVIDER_WARMUP_TIMEOUT,
+        )
+
+
+@app.on_event("shutdown")
+async def _close_provider_clients() -> None:
+    """Close pooled provider HTTP clients when the server stops."""
+    await aclose_shared_clients()
+
+
+T = TypeVar("T")
+
+# How often a long-running request checks whether the browser went away.
+_DISCONNECT_POLL_SECONDS = 1.0
+
+
+async def _cancel_on_disconnect(request: Request, coro: Awaitable[T]) -> T:
+    """Await ``coro``, cancelling it if the client disconnects first.
+
+    Stops paying for LLM generation the user has already abandoned
+    (closed tab, aborted fetch). Raises HTTPException 499 on disconnect.
+    """
+    task = asyncio.ensure_future(coro)
+    while True:
+        done, _ = await asyncio.wait({task}, timeout=_DISCONNECT_POLL_SECONDS)
+        if done:
+            return task.result()
+        if await request.is_disconnected():
+            task.cancel()
+            logger.info("Client disconnected; cancelled %s", request.url.path)
+            raise HTTPException(status_code=499, detail="Client disconnected")
 
 
 def _api_error(message: str, status_code: int = 500) -> HTTPException:
@@ -60,6 +122,21 @@ class TopicRequest(BaseModel):
     max_length: int = 1000
 
 
+def _parse_topic_request(body: Dict[str, Any]) -> TopicRequest:
+    """Build a TopicRequest from a raw JSON object, defaulting bad max_length."""
+    try:
+        max_length_val = body.get("max_length", DEFAULT_MAX_LENGTH)
+        max_length_val = (
+            int(max_length_val) if max_length_val is not None else DEFAULT_MAX_LENGTH
+        )
+    except (TypeError, ValueError):
+        max_length_val = DEFAULT_MAX_LENGTH
+    return TopicRequest(
+        topic=body.get("topic", ""),
+        max_length=max_length_val,
+    )
+
+
 class RegenerateResearchRequest(BaseModel):
     topic: str
     max_length: int = 1000
@@ -76,6 +153,14 @@ class RegenerateEditRequest(BaseModel):
     draft_content: str
 
 
+class RegenerateMultiRequest(BaseModel):
+    stages: List[Literal["research", "draft", "edit"]]
+    topic: str
+    max_length: int = 1000
+    research_data: Optional[str] = None
+    draft_content: Optional[str] = None
+
+
 class ArticleResponse(BaseModel):
     topic: str
     research_stage: Dict[str, Any]
@@ -91,25 +176,20 @@ async def home(request: Request) -> HTMLResponse:
 
 
 @app.post("/generate", response_model=ArticleResponse)
-async def generate_article(request: Request) -> ArticleResponse:
+async def generate_article(
+    request: Request, pipeline: NewspaperPipeline = Depends(get_pipeline)
+) -> ArticleResponse:
     """Run full research → draft → edit pipeline for the given topic and word limit."""
-    body = await request.json()
-    try:
-        max_length_val = body.get("max_length", DEFAULT_MAX_LENGTH)
-        max_length_val = (
-            int(max_length_val) if max_length_val is not None else DEFAULT_MAX_LENGTH
-        )
-    except (TypeError, ValueError):
-        max_length_val = DEFAULT_MAX_LENGTH
-    req = TopicRequest(
-        topic=body.get("topic", ""),
-        max_length=max_length_val,
-    )
+    body = orjson.loads(await request.body())
+    req = _parse_topic_request(body)
     try:
         start = time.time()
-        result = await pipeline.run_pipeline(
-            topic=req.topic,
-            max_length=req.max_length,
+        result = await _cancel_on_disconnect(
+            request,
+            pipeline.run_pipeline(
+                topic=req.topic,
+                max_length=req.max_length,
+            ),
         )
         elapsed = time.time() - start
         return ArticleResponse(
@@ -119,16 +199,92 @@ async def generate_article(request: Request) -> ArticleResponse:
             final_stage=result["final_stage"],
             processing_time=elapsed,
         )
+    except HTTPException:
+        raise
     except Exception as e:
         raise _api_error(f"Error generating article: {str(e)}")
 
 
+def _sse_frame(event: str, data: Any) -> str:
+    """Format one server-sent event frame."""
+    return f"event: {event}\ndata: {orjson.dumps(data).decode()}\n\n"
+
+
+@app.post("/generate/stream")
+async def generate_article_stream(
+    request: Request, pipeline: NewspaperPipeline = Depends(get_pipeline)
+) -> StreamingResponse:
+    """Run the pipeline and stream stage results and draft text as server-sent events.
+
+    Emits research_chunk, draft_chunk and final_chunk events with incremental
+    text, the research_stage, draft_stage and final_stage results, then a done
+    event carrying processing_time.
+    """
+    body = orjson.loads(await request.body())
+    req = _parse_topic_request(body)
+
+    async def events() -> AsyncIterator[str]:
+        start = time.time()
+        try:
+            async for event in pipeline.stream_pipeline(req.topic, req.max_length):
+                yield _sse_frame(event["event"], event["data"])
+        except Exception as e:
+            logger.exception("Streaming pipeline failed: %s", e)
+            yield _sse_frame("error", {"detail": f"Error generating article: {e}"})
+        yield _sse_frame(
+            "done", {"topic": req.topic, "processing_time": time.time() - start}
+        )
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
+@app.post("/generate-batch")
+async def generate_batch(
+    request: Request, pipeline: NewspaperPipeline = Depends(get_pipeline)
+) -> Dict[str, Any]:
+    """Run the pipeline for a JSON list of {topic, max_length} objects concurrently.
+
+    At most MAX_BATCH_SIZE items; every item must be a JSON object.
+    """
+    body = orjson.loads(await request.body())
+    if not isinstance(body, list):
+        raise _api_error("Expected a JSON list of topic objects", status_code=400)
+    if len(body) > MAX_BATCH_SIZE:
+        raise _api_error(
+            f"Batch too large: {len(body)} items (max {MAX_BATCH_SIZE})",
+            status_code=400,
+        )
+    if not all(isinstance(item, dict) for item in body):
+        raise _api_error("Every batch item must be a topic object", status_code=400)
+    reqs = [_parse_topic_request(item) for item in body]
+    start = time.time()
+    results = await _cancel_on_disconnect(
+        request,
+        pipeline.run_pipeline_batch([(req.topic, req.max_length) for req in reqs]),
+    )
+    elapsed = time.time() - start
+    articles = []
+    for req, result in zip(reqs, results):
+        if isinstance(result, Exception):
+            logger.error("Batch article failed for %r: %s", req.topic, result)
+            articles.append(
+                {"topic": req.topic, "error": f"Error generating article: {result}"}
+            )
+        else:
+            articles.append({"topic": req.topic, **result})
+    return {"articles": articles, "processing_time": elapsed}
+
+
 @app.post("/regenerate-research")
-async def regenerate_research(req: RegenerateResearchRequest) -> Dict[str, Any]:
+async def regenerate_research(
+    req: RegenerateResearchRequest, pipeline: NewspaperPipeline = Depends(get_pipeline)
+) -> Dict[str, Any]:
     """Regenerate only the research stage for the given topic."""
     try:
         start = time.time()
-        result = await pipeline.research_stage(req.topic, req.max_length)
+        result = await pipeline.research_stage(
+            req.topic, req.max_length, refresh=True
+        )
         elapsed = time.time() - start
         return {"research_stage": result, "processing_time": elapsed}
     except Exception as e:
@@ -136,12 +292,14 @@ async def regenerate_research(req: RegenerateResearchRequest) -> Dict[str, Any]:
 
 
 @app.post("/regenerate-draft")
-async def regenerate_draft(req: RegenerateDraftRequest) -> Dict[str, Any]:
+async def regenerate_draft(
+    req: RegenerateDraftRequest, pipeline: NewspaperPipeline = Depends(get_pipeline)
+) -> Dict[str, Any]:
     """Regenerate only the draft stage using the provided research data."""
     try:
         start = time.time()
         result = await pipeline.draft_stage(
-            req.topic, req.research_data, req.max_length
+            req.topic, req.research_data, req.max_length, refresh=True
         )
         elapsed = time.time() - start
         return {"draft_stage": result, "processing_time": elapsed}
@@ -150,13 +308,15 @@ async def regenerate_draft(req: RegenerateDraftRequest) -> Dict[str, Any]:
 
 
 @app.post("/regenerate-edit")
-async def regenerate_edit(req: RegenerateEditRequest) -> Dict[str, Any]:
+async def regenerate_edit(
+    req: RegenerateEditRequest, pipeline: NewspaperPipeline = Depends(get_pipeline)
+) -> Dict[str, Any]:
     """Regenerate only the edit stage for the given draft content."""
     try:
         start = time.time()
         max_length = max(100, len(req.draft_content.split()))
         result = await pipeline.edit_stage(
-            req.topic, req.draft_content, max_length=max_length
+            req.topic, req.draft_content, max_length=max_length, refresh=True
         )
         elapsed = time.time() - start
         return {"final_stage": result, "processing_time": elapsed}
@@ -164,10 +324,87 @@ async def regenerate_edit(req: RegenerateEditRequest) -> Dict[str, Any]:
         raise _api_error(f"Regenerate edit failed: {str(e)}")
 
 
+@app.post("/regenerate-multi")
+async def regenerate_multi(
+    req: RegenerateMultiRequest, pipeline: NewspaperPipeline = Depends(get_pipeline)
+) -> Dict[str, Any]:
+    """Regenerate several stages in one request.
+
+    A stage waits only on the upstream stage if that one is also being
+    regenerated; otherwise it uses the supplied research_data/draft_content
+    and runs concurrently with the others.
+    """
+    stages = set(req.stages)
+    if not stages:
+        raise _api_error("No stages requested", status_code=400)
+    if "draft" in stages and "research" not in stages and not req.research_data:
+        raise _api_error("research_data is required to regenerate draft", 400)
+    if "edit" in stages and "draft" not in stages and not req.draft_content:
+        raise _api_error("draft_content is required to regenerate edit", 400)
+
+    research_task: Optional[asyncio.Task] = None
+    draft_task: Optional[asyncio.Task] = None
+
+    async def draft() -> Dict[str, Any]:
+        research_data = req.research_data
+        if research_task is not None:
+            research = await research_task
+            if research["status"] != "success":
+                return {
+                    "status": "skipped",
+                    "message": "Draft stage skipped due to research failure",
+                    "draft_content": "Cannot generate draft without research data",
+                }
+            research_data = research["research_data"]
+        return await pipeline.draft_stage(
+            req.topic, research_data, req.max_length, refresh=True
+        )
+
+    async def edit() -> Dict[str, Any]:
+        draft_content = req.draft_content
+        if draft_task is not None:
+            drafted = await draft_task
+            if drafted["status"] != "success":
+                return {
+                    "status": "skipped",
+                    "message": "Edit stage skipped due to draft failure",
+                    "final_content": "Cannot edit without draft content",
+                }
+            draft_content = drafted["draft_content"]
+        return await pipeline.edit_stage(
+            req.topic, draft_content, max_length=req.max_length, refresh=True
+        )
+
+    try:
+        start = time.time()
+        tasks: Dict[str, asyncio.Task] = {}
+        if "research" in stages:
+            research_task = asyncio.create_task(
+                pipeline.research_stage(req.topic, req.max_length, refresh=True)
+            )
+            tasks["research_stage"] = research_task
+        if "draft" in stages:
+            draft_task = asyncio.create_task(draft())
+            tasks["draft_stage"] = draft_task
+        if "edit" in stages:
+            tasks["final_stage"] = asyncio.create_task(edit())
+        results = await asyncio.gather(*tasks.values())
+        elapsed = time.time() - start
+        return {**dict(zip(tasks, results)), "processing_time": elapsed}
+    except Exception as e:
+        raise _api_error(f"Regenerate stages failed: {str(e)}")
+
+
 @app.get("/health")
-async def health_check() -> Dict[str, str]:
-    """Return service health status for load balancers and monitoring."""
-    return {"status": "healthy", "service": "AI Newspaper Agent"}
+async def health_check(
+    pipeline: NewspaperPipeline = Depends(get_pipeline),
+) -> Dict[str, Any]:
+    """Return service health status and stage cache hit/miss counts."""
+    return {
+        "status": "healthy",
+        "service": "AI Newspaper Agent",
+        "stage_cache": dict(pipeline.cache_stats),
+    }
 
 
 def run() -> None:
@@ -179,6 +416,7 @@ def run() -> None:
         host=APP_HOST,
         port=APP_PORT,
         reload=DEBUG,
+        workers=None if DEBUG else APP_WORKERS,
     )
 
 
@@ -11,28 +11,203 @@ _root = os.path.dirname(_app_dir)
 if _root not in sys.path:
     sys.path.insert(0, _root)
 
+import asyncio
+import functools
+import hashlib
+import inspect
 import logging
 import re
-from typing import Any, Dict, List
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import httpx
-from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_openai import ChatOpenAI
+import orjson
+from langchain_core.messages import BaseMessage
+from langchain_core.prompts import ChatPromptTemplate
+from tenacity import retry, retry_if_exception, stop_after_attempt
 
 from app.config import (
-    DEEPSEEK_API_KEY,
     DEEPSEEK_BASE_URL,
+    DEEPSEEK_HTTP_BACKEND,
+    DEEPSEEK_MAX_CONC,
+    DRAFT_EDIT_OVERLAP,
+    DRAFT_MAX_INPUT_TOKENS,
+    FUSED_RESEARCH_MAX_WORDS,
     GEMINI_EDIT_MODEL,
     GEMINI_FALLBACK_MODEL,
-    GOOGLE_API_KEY,
-    OPENAI_API_KEY,
+    GEMINI_MAX_CONC,
+    HTTP_KEEPALIVE_EXPIRY,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    LLM_SEED,
+    OPENAI_MAX_CONC,
+    settings,
+)
+from app.llm_cache import (
+    cache_key,
+    create_llm_cache,
+    create_stage_cache,
+    is_cacheable,
+    stage_cache_key,
 )
+from app.resilience import (
+    RETRY_ATTEMPTS,
+    CircuitBreaker,
+    CircuitOpenError,
+    is_provider_failure,
+    is_retryable,
+    wait_retry_after,
+)
+
+if TYPE_CHECKING:
+    from langchain_google_genai import ChatGoogleGenerativeAI
+    from langchain_openai import ChatOpenAI
+
+try:
+    import aiohttp
+except ImportError:  # optional: only needed for DEEPSEEK_HTTP_BACKEND=aiohttp
+    aiohttp = None
 
 logger = logging.getLogger(__name__)
 
+# Provider/transport failures a stage reports as status "error". Anything
+# else is a bug and propagates; CancelledError (a BaseException) always
+# propagates so abandoned requests stop their LLM calls. The OpenAI and
+# Google SDKs are imported lazily by the client factories, which add their
+# error types via _add_provider_errors.
+_PROVIDER_ERRORS: Tuple[type, ...] = (
+    httpx.HTTPError,
+    RuntimeError,
+    ValueError,
+)
+
+
+def _add_provider_errors(*errors: type) -> None:
+    global _PROVIDER_ERRORS
+    _PROVIDER_ERRORS = tuple(dict.fromkeys(_PROVIDER_ERRORS + errors))
+
+
+# Prompt templates: built once at import, filled per call with format_map.
+# Keeping them static also keeps LLM cache keys stable across calls.
+_RESEARCH_PROMPT = """Research the topic: "{topic}"
+
+{fact_instruction}
+
+For each finding, use this exact format on its own line:
+FACT: <the finding or statistic> | SOURCE: <source name, study, or citation>
+
+Example:
+FACT: Global temperatures have risen 1.1°C since pre-industrial. | SOURCE: IPCC
+FACT: Renewable energy 30% of global electricity in 2024. | SOURCE: IEA
+
+Do not exceed facts requested. Keep concise for {max_length}-word article."""
+
+_DRAFT_BLURB_PROMPT = (
+    "Based on this research, write a VERY BRIEF news blurb of "
+    """exactly {max_length} words about "{topic}".
+
+Research Data:
+{research_data}
+
+Requirements:
+- Write a VERY BRIEF news blurb of exactly {max_length} words.
+- Just 2-3 key points. No introduction or conclusion needed.
+- One short paragraph is fine. Be direct.
+- Use FACT: ... | SOURCE: ... only as background; write the blurb in normal prose.
+"""
+)
+
+_DRAFT_ARTICLE_PROMPT = """
+Based on the research below, write a compelling newspaper article about "{topic}".
+{concise_instruction}
+Research Data:
+{research_data}
+
+Requirements:
+- Write in a professional journalistic style
+- Include a compelling headline
+- Structure with clear paragraphs
+- Include relevant facts and context
+- Maintain objectivity and accuracy
+- Target length: approximately {max_length} words (strict limit)
+- Use proper news article formatting
+
+Provide the complete article draft. Do not exceed {max_length} words.
+"""
+
+_EDIT_SYSTEM_PROMPT = (
+    "You are an experienced newspaper editor with expertise "
+    "in polishing journalistic content."
+)
+
+_EDIT_PROMPT = """
+As an experienced editor, review and polish the following article about "{topic}":
+{concise_instruction}
+
+{draft_content}
+
+Please:
+1. Improve clarity and flow
+2. Enhance readability and engagement
+3. Ensure proper grammar and style
+4. Optimize headline for impact
+5. Add compelling subheadings if needed (only if length allows)
+6. Maintain journalistic integrity
+7. Ensure the article is publication-ready
+
+Provide the final polished version. Keep length ~{max_length} words max.
+"""
+
+# Used for draft segments edited while the draft streams (DRAFT_EDIT_OVERLAP):
+# the joined segments must read as one article with a single headline.
+_EDIT_SEGMENT_PROMPT = """
+As an experienced editor, polish this section of a longer article about "{topic}":
+{concise_instruction}
+
+{draft_content}
+
+Please:
+1. Improve clarity and flow
+2. Ensure proper grammar and style
+3. Keep any existing headline or subheading; do not add new ones
+4. Do not add an introduction or conclusion; other sections surround this one
+5. Maintain journalistic integrity
+
+Provide only the polished section. Keep length ~{max_length} words max.
+"""
+
+# Built once; format_messages() only substitutes the per-call values.
+_EDIT_TEMPLATE = ChatPromptTemplate.from_messages(
+    [("system", _EDIT_SYSTEM_PROMPT), ("human", _EDIT_PROMPT)]
+)
+_EDIT_SEGMENT_TEMPLATE = ChatPromptTemplate.from_messages(
+    [("system", _EDIT_SYSTEM_PROMPT), ("human", _EDIT_SEGMENT_PROMPT)]
+)
+
+_FUSED_PROMPT = """Write a short news article about "{topic}" in two parts.
+
+Part 1 - research. {fact_instruction}
+Use this exact format, one per line:
+FACT: <the finding or statistic> | SOURCE: <source name, study, or citation>
+
+Part 2 - on its own line write "ARTICLE:", then the article using only those facts.
+- Professional journalistic style with a compelling headline
+- Target length: approximately {max_length} words (strict limit)
+"""
+
 
 # Token limits: stricter for short articles (<200 words)
+@functools.lru_cache(maxsize=128)
 def word_count_to_max_tokens(word_count: int) -> int:
     """Convert target word count to max_tokens for API calls."""
     if word_count < 200:
@@ -40,78 +215,613 @@ def word_count_to_max_tokens(word_count: int) -> int:
     return max(100, int(word_count * 1.33))
 
 
+_SENT_RE = re.compile(r"(?<=[.!?])\s+")
+
+
+# From the first FACT: to the end of the last FACT: line, dropping the model's
+# intro/outro chatter around the findings.
+_FACT_SPAN_RE = re.compile(r"FACT:(?:.*FACT:)?[^\n]*", re.DOTALL)
+
+
+def research_max_tokens(max_length: int) -> int:
+    """DeepSeek output budget for research backing a ``max_length``-word article.
+
+    Scales with the article (1.4 tokens per word) up to the old fixed 2000,
+    with a floor so short articles still get complete FACT/SOURCE lines.
+    """
+    return max(300, min(2000, int(max_length * 1.4)))
+
+
+def _strip_research_boilerplate(research_data: str) -> str:
+    """Keep only the FACT block of research output (unchanged if it has none)."""
+    match = _FACT_SPAN_RE.search(research_data or "")
+    return match.group(0) if match else research_data
+
+
+@functools.lru_cache(maxsize=8)
+def _token_encoding(model: str) -> Any:
+    """tiktoken encoding for ``model``, or None (not installed, unknown, offline)."""
+    try:
+        import tiktoken
+
+        return tiktoken.encoding_for_model(model)
+    except Exception as e:  # ImportError, KeyError, or failed encoding download
+        logger.info("No tiktoken encoding for %s (%s); estimating tokens", model, e)
+        return None
+
+
+def _truncate_for_model(text: str, model: str, max_tokens: int) -> str:
+    """Cut ``text`` to about ``max_tokens`` tokens of ``model``, at a line break.
+
+    Uses tiktoken when available, else estimates 4 characters per token.
+    """
+    if len(text) <= max_tokens:  # every token is at least one character
+        return text
+    encoding = _token_encoding(model)
+    if encoding is None:
+        if len(text) <= max_tokens * 4:
+            return text
+        cut = text[: max_tokens * 4]
+    else:
+        # Research is plain text: "<|endoftext|>" etc. are counted, not rejected.
+        tokens = encoding.encode(text, disallowed_special=())
+        if len(tokens) <= max_tokens:
+            return text
+        cut = encoding.decode(tokens[:max_tokens])
+    head, newline, _ = cut.rpartition("\n")
+    return head if newline else cut
+
+
+# Every character str.split() treats as whitespace in the ASCII range.
+_ASCII_WHITESPACE = " \t\n\r\v\f\x1c\x1d\x1e\x1f"
+_WHITESPACE_RUN_RE = re.compile(r"\s+")
+
+
+def _word_count_fast(text: str) -> int:
+    """Upper bound on ``len(text.split())`` without building the word list.
+
+    ASCII text counts its whitespace characters; other text counts ``\\s+``
+    runs, which covers NBSP and the other Unicode spaces str.split() uses.
+    """
+    if not text:
+        return 0
+    if text.isascii():
+        return sum(map(text.count, _ASCII_WHITESPACE)) + 1
+    return sum(1 for _ in _WHITESPACE_RUN_RE.finditer(text)) + 1
+
+
 def _truncate_to_word_count(text: str, target_words: int) -> str:
     """Truncate at sentence boundary if >20% over target."""
     if not text or target_words <= 0:
         return text
-    words = text.split()
-    if len(words) <= int(target_words * 1.2):
+    limit = int(target_words * 1.2)
+    # Cheap upper bound first; only scan sentences when near or over the limit.
+    if _word_count_fast(text) <= limit:
         return text
-    sentences = re.split(r"(?<=[.!?])\s+", text)
+    # Single pass: keep whole sentences up to target, stop once over limit.
     result: list[str] = []
     count = 0
-    for s in sentences:
+    total = 0
+    keeping = True
+    for s in _SENT_RE.split(text):
         s_words = len(s.split())
-        if count + s_words <= target_words:
+        total += s_words
+        if keeping and count + s_words <= target_words:
             result.append(s)
             count += s_words
         else:
+            keeping = False
+        if total > limit:
             break
+    if total <= limit:
+        return text
     truncated = " ".join(result).strip()
     if not truncated:
-        truncated = " ".join(words[:target_words])
+        truncated = " ".join(text.split()[:target_words])
     return truncated
 
 
+@functools.lru_cache(maxsize=128)
+def _fact_instruction(max_length: int) -> str:
+    """Return how many research facts to request for the article length."""
+    if max_length < 150:
+        return "Provide at most 3 facts. Very brief. One line per fact."
+    if max_length <= 500:
+        return "Provide 5-7 facts. Concise."
+    return "Provide 10-15 facts (full research)."
+
+
+@functools.lru_cache(maxsize=128)
+def _prompt_flags(max_length: int) -> Tuple[str, bool, bool, int]:
+    """Return (fact_instruction, is_blurb, is_short, max_tokens) for a length.
+
+    is_blurb is under 150 words; is_short is 150-199 words.
+    """
+    is_blurb = max_length < 150
+    is_short = max_length < 200 and not is_blurb
+    return (
+        _fact_instruction(max_length),
+        is_blurb,
+        is_short,
+        word_count_to_max_tokens(max_length),
+    )
+
+
 def _count_words(text: str) -> int:
     """Return word count (split on whitespace)."""
     return len(text.split()) if text else 0
 
 
+# Texts longer than this are post-processed in a worker thread.
+_THREAD_OFFLOAD_CHARS = 8192
+
+
+def _truncate_and_count(text: str, target_words: int) -> Tuple[str, int]:
+    """Truncate to the target word count and return (text, word count)."""
+    text = _truncate_to_word_count(text, target_words)
+    return text, _count_words(text)
+
+
+async def _finalize_text(text: str, target_words: int) -> Tuple[str, int]:
+    """Truncate and count words off the event loop when the text is large."""
+    if text and len(text) > _THREAD_OFFLOAD_CHARS:
+        return await asyncio.to_thread(_truncate_and_count, text, target_words)
+    return _truncate_and_count(text, target_words)
+
+
+async def _trim_research(research_data: str, model: str) -> str:
+    """Strip research boilerplate and cap it at DRAFT_MAX_INPUT_TOKENS.
+
+    Token counting runs in a worker thread: loading a tiktoken encoding may
+    download its BPE file, and encoding long research is CPU-bound.
+    """
+    text = _strip_research_boilerplate(research_data)
+    if len(text) <= DRAFT_MAX_INPUT_TOKENS:  # every token is at least one char
+        return text
+    return await asyncio.to_thread(
+        _truncate_for_model, text, model, DRAFT_MAX_INPUT_TOKENS
+    )
+
+
+@retry(
+    stop=stop_after_attempt(RETRY_ATTEMPTS),
+    wait=wait_retry_after,
+    retry=retry_if_exception(is_retryable),
+    reraise=True,
+)
+async def _ainvoke_text(llm: Any, prompt: Any, **kwargs: Any) -> str:
+    """Invoke a LangChain chat model and return the response text.
+
+    Transient provider errors (429, 5xx, connection) are retried with backoff.
+    """
+    response = await llm.ainvoke(prompt, **kwargs)
+    return response.content if hasattr(response, "content") else str(response)
+
+
+def _message_dicts(messages: List[BaseMessage]) -> List[Dict[str, str]]:
+    """Convert LangChain messages to plain role/content dicts (for cache keys)."""
+    return [{"role": m.type, "content": str(m.content)} for m in messages]
+
+
+_DRAFT_SKIPPED: Dict[str, Any] = {
+    "status": "skipped",
+    "message": "Draft stage skipped due to research failure",
+    "draft_content": "Cannot generate draft without research data",
+}
+_EDIT_SKIPPED: Dict[str, Any] = {
+    "status": "skipped",
+    "message": "Edit stage skipped due to draft failure",
+    "final_content": "Cannot edit without draft content",
+}
+
+
+def _pooled_http_client(**kwargs: Any) -> httpx.AsyncClient:
+    """HTTP/2 client with a keep-alive pool sized for concurrent pipeline runs."""
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+        ),
+        **kwargs,
+    )
+
+
+# Draft text is handed to the editor in paragraph-aligned segments of at least
+# this many words (~200 tokens) when DRAFT_EDIT_OVERLAP is on.
+_OVERLAP_SEGMENT_WORDS = 150
+
+# Part of every stage cache key: derived from the prompt templates and the
+# research trimming rules, so editing any of them invalidates cached stage
+# results (including ones persisted under CACHE_DIR).
+PROMPT_VERSION = hashlib.blake2b(
+    "\0".join(
+        (
+            _RESEARCH_PROMPT,
+            _DRAFT_BLURB_PROMPT,
+            _DRAFT_ARTICLE_PROMPT,
+            _EDIT_SYSTEM_PROMPT,
+            _EDIT_PROMPT,
+            _EDIT_SEGMENT_PROMPT,
+            _FACT_SPAN_RE.pattern,
+            str(DRAFT_MAX_INPUT_TOKENS),
+        )
+    ).encode("utf-8"),
+    digest_size=8,
+).hexdigest()
+
+
+# Only the OpenAI client is sent LLM_SEED (see _get_openai_llm). DeepSeek and
+# Gemini sample unseeded, so their temperature > 0 output is never cached.
+_SEEDED_PROVIDERS = frozenset({"openai"})
+
+
+def _provider_seed(provider: str) -> Optional[int]:
+    """The sampling seed actually sent to ``provider``, or None."""
+    return LLM_SEED if provider in _SEEDED_PROVIDERS else None
+
+
+def _stage_cached(stage: str) -> Callable:
+    """Cache a pipeline stage's successful results, keyed on its arguments.
+
+    Follows the LLM cache policy: a stage whose model samples (temperature
+    > 0) is only cached when its provider is sent a seed. The wrapped method
+    takes a ``refresh`` keyword: True skips the stage and LLM response cache
+    lookups and overwrites both stored results (used by the regenerate
+    endpoints). It is passed through to the method but is not part of the
+    cache key.
+    """
+
+    def decorator(method: Callable) -> Callable:
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        async def wrapper(
+            self: "NewspaperPipeline", *args: Any, refresh: bool = False, **kwargs: Any
+        ) -> Dict[str, Any]:
+            cache = self._stage_cache
+            if cache is None or not self._stage_cacheable(stage):
+                return await method(self, *args, refresh=refresh, **kwargs)
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            inputs = {
+                k: v for k, v in bound.arguments.items() if k not in ("self", "refresh")
+            }
+            key = stage_cache_key(
+                stage, self._stage_model(stage), PROMPT_VERSION, inputs
+            )
+            if not refresh:
+                cached = await cache.get(key)
+                if cached is not None:
+                    self.cache_stats["hits"] += 1
+                    logger.info("Stage cache hit (%s)", stage)
+                    return orjson.loads(cached)
+            self.cache_stats["misses"] += 1
+            result = await method(self, *args, refresh=refresh, **kwargs)
+            if result.get("status") == "success":
+                await cache.set(key, orjson.dumps(result).decode())
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+# Cheap authenticated GET used to open a pooled connection at startup.
+_DEEPSEEK_MODELS_URL = DEEPSEEK_BASE_URL.replace("/chat/completions", "/models")
+
+# Request bodies are pre-encoded with orjson, so the type is set explicitly.
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _is_model_not_found(e: Exception) -> bool:
+    """True if a Gemini error says the requested model does not exist."""
+    return "not found" in str(e).lower() or "404" in str(e)
+
+
+def _record_gemini_outcome(breaker: CircuitBreaker, e: Exception) -> None:
+    """Count a failed primary-model edit against the Gemini breaker.
+
+    Provider failures and a missing model (which should route edits to the
+    fallback) trip it; request-specific errors only end a half-open trial.
+    """
+    if is_provider_failure(e) or _is_model_not_found(e):
+        breaker.record_failure()
+    else:
+        breaker.release()
+
+
+class DeepSeekError(RuntimeError):
+    """A DeepSeek call failed: HTTP error status, timeout, transport or bad body."""
+
+
+# Raised while decoding a DeepSeek body that is not the expected JSON shape.
+_MALFORMED_RESPONSE = (ValueError, KeyError, IndexError, TypeError)
+
+
+def _deepseek_error(e: Exception) -> DeepSeekError:
+    """Log a DeepSeek failure and wrap it; callers chain it with ``from e``."""
+    if isinstance(e, httpx.HTTPStatusError):
+        detail = f"HTTP {e.response.status_code}: {e.response.text}"
+        logger.exception("DeepSeek API HTTP error: %s", detail)
+        return DeepSeekError(f"DeepSeek API error: {detail}")
+    if isinstance(e, httpx.TimeoutException):
+        logger.exception("DeepSeek API request timed out")
+        return DeepSeekError("DeepSeek API error: Request timeout")
+    if isinstance(e, _MALFORMED_RESPONSE):
+        logger.exception("DeepSeek API returned a malformed response: %s", e)
+        return DeepSeekError(f"DeepSeek API error: malformed response ({e!r})")
+    logger.exception("DeepSeek API error: %s", e)
+    return DeepSeekError(f"DeepSeek API error: {str(e)}")
+
+
+def _raise_for_aiohttp_status(status: int, headers: Any, body: bytes) -> None:
+    """Raise httpx.HTTPStatusError for an aiohttp 4xx/5xx response."""
+    if status < 400:
+        return
+    request = httpx.Request("POST", DEEPSEEK_BASE_URL)
+    response = httpx.Response(
+        status, headers=dict(headers), content=body, request=request
+    )
+    raise httpx.HTTPStatusError(f"HTTP {status}", request=request, response=response)
+
+
+def _httpx_error_from_aiohttp(e: Exception) -> httpx.HTTPError:
+    """Map an aiohttp timeout/client error to the matching httpx exception."""
+    request = httpx.Request("POST", DEEPSEEK_BASE_URL)
+    if isinstance(e, asyncio.TimeoutError):
+        return httpx.TimeoutException(str(e), request=request)
+    return httpx.TransportError(str(e), request=request)
+
+
 class DeepSeekLLM:
-    """DeepSeek API wrapper for the research stage."""
+    """DeepSeek API wrapper for the research stage.
+
+    Holds one pooled HTTP/2 ``httpx.AsyncClient`` so repeated calls reuse the
+    keep-alive TCP/TLS connection instead of re-handshaking per request.
+    With DEEPSEEK_HTTP_BACKEND=aiohttp a shared ``aiohttp.ClientSession`` is
+    used instead; its errors are raised as the equivalent httpx exceptions so
+    retries and error reporting behave the same on both backends.
+    """
+
+    model = "deepseek-chat"
+    temperature = 0.7
 
     def __init__(self, api_key: str):
         self.api_key = api_key
+        self._client = self._new_client()
+        self._session: Any = None
+        self.backend = DEEPSEEK_HTTP_BACKEND
+        if self.backend == "aiohttp" and aiohttp is None:
+            logger.warning("aiohttp not installed - DeepSeek falls back to httpx")
+            self.backend = "httpx"
 
-    async def agenerate(self, prompt: str, **kwargs) -> str:
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
-        data = {
-            "model": "deepseek-chat",
+    def _new_client(self) -> httpx.AsyncClient:
+        # Auth headers are set once on the client, not rebuilt per request.
+        # A short connect timeout fails fast on an unreachable host while
+        # reads keep the full budget for long generations.
+        return _pooled_http_client(
+            timeout=httpx.Timeout(60.0, connect=10.0),
+            headers={"Authorization": f"Bearer {self.api_key}"},
+        )
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled client, reopening it if it was closed."""
+        if self._client.is_closed:
+            self._client = self._new_client()
+        return self._client
+
+    def _get_session(self) -> Any:
+        """Return the shared aiohttp session, creating it inside the running loop."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=32,
+                    use_dns_cache=True,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75,
+                ),
+                timeout=aiohttp.ClientTimeout(total=60.0, connect=10.0),
+                headers={"Authorization": f"Bearer {self.api_key}"},
+            )
+        return self._session
+
+    def _payload(self, prompt: str, max_tokens: int) -> Dict[str, Any]:
+        return {
+            "model": self.model,
             "messages": [{"role": "user", "content": prompt}],
-            "temperature": 0.7,
-            "max_tokens": 2000,
+            "temperature": self.temperature,
+            "max_tokens": max_tokens,
+            "stream": False,
         }
+
+    async def agenerate(self, prompt: str, max_tokens: int = 2000, **kwargs) -> str:
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    DEEPSEEK_BASE_URL, headers=headers, json=data
-                )
-                response.raise_for_status()
-                result = response.json()
-                return result["choices"][0]["message"]["content"]
-        except httpx.HTTPStatusError as e:
-            detail = f"HTTP {e.response.status_code}: {e.response.text}"
-            logger.exception("DeepSeek API HTTP error: %s", detail)
-            raise RuntimeError(f"DeepSeek API error: {detail}") from e
-        except httpx.TimeoutException:
-            logger.exception("DeepSeek API request timed out")
-            raise RuntimeError("DeepSeek API error: Request timeout") from None
-        except Exception as e:
-            logger.exception("DeepSeek API error: %s", e)
-            raise RuntimeError(f"DeepSeek API error: {str(e)}") from e
+            body = await self._post(self._payload(prompt, max_tokens))
+        except httpx.HTTPError as e:
+            raise _deepseek_error(e) from e
+        try:
+            return orjson.loads(body)["choices"][0]["message"]["content"]
+        except _MALFORMED_RESPONSE as e:
+            raise _deepseek_error(e) from e
+
+    async def astream(
+        self, prompt: str, max_tokens: int = 2000, **kwargs
+    ) -> AsyncIterator[str]:
+        """Yield completion text deltas as DeepSeek streams them (SSE).
+
+        Not retried: a stream that fails part-way cannot be replayed safely.
+        """
+        data = {**self._payload(prompt, max_tokens), "stream": True}
+        try:
+            async for line in self._stream_lines(data):
+                if not line.startswith("data:"):
+                    continue
+                payload = line[5:].strip()
+                if payload == "[DONE]":
+                    break
+                delta = orjson.loads(payload)["choices"][0].get("delta", {})
+                if delta.get("content"):
+                    yield delta["content"]
+        except (httpx.HTTPError, *_MALFORMED_RESPONSE) as e:
+            raise _deepseek_error(e) from e
+
+    @retry(
+        stop=stop_after_attempt(RETRY_ATTEMPTS),
+        wait=wait_retry_after,
+        retry=retry_if_exception(is_retryable),
+        reraise=True,
+    )
+    async def _post(self, data: Dict[str, Any]) -> bytes:
+        """POST to DeepSeek and return the body, retrying 429/5xx with backoff."""
+        if self.backend == "aiohttp":
+            return await self._post_aiohttp(data)
+        response = await self._get_client().post(
+            DEEPSEEK_BASE_URL, content=orjson.dumps(data), headers=_JSON_HEADERS
+        )
+        logger.debug(
+            "DeepSeek %s over %s", response.status_code, response.http_version
+        )
+        response.raise_for_status()
+        return response.content
+
+    async def _post_aiohttp(self, data: Dict[str, Any]) -> bytes:
+        try:
+            async with self._get_session().post(
+                DEEPSEEK_BASE_URL, data=orjson.dumps(data), headers=_JSON_HEADERS
+            ) as resp:
+                body = await resp.read()
+                _raise_for_aiohttp_status(resp.status, resp.headers, body)
+                return body
+        except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+            raise _httpx_error_from_aiohttp(e) from e
+
+    async def _stream_lines(self, data: Dict[str, Any]) -> AsyncIterator[str]:
+        """POST ``data`` and yield the response body line by line."""
+        if self.backend == "aiohttp":
+            try:
+                session = self._get_session()
+                async with session.post(
+                    DEEPSEEK_BASE_URL, data=orjson.dumps(data), headers=_JSON_HEADERS
+                ) as resp:
+                    if resp.status >= 400:
+                        body = await resp.read()
+                        _raise_for_aiohttp_status(resp.status, resp.headers, body)
+                    async for raw in resp.content:
+                        yield raw.decode("utf-8")
+            except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+                raise _httpx_error_from_aiohttp(e) from e
+            return
+        client = self._get_client()
+        async with client.stream(
+            "POST",
+            DEEPSEEK_BASE_URL,
+            content=orjson.dumps(data),
+            headers=_JSON_HEADERS,
+        ) as response:
+            if response.is_error:
+                await response.aread()
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                yield line
+
+    async def warmup(self) -> None:
+        """Open a pooled connection (DNS, TCP, TLS) with a GET /models."""
+        if self.backend == "aiohttp":
+            async with self._get_session().get(_DEEPSEEK_MODELS_URL) as resp:
+                await resp.read()
+        else:
+            await self._get_client().get(_DEEPSEEK_MODELS_URL)
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client(s) and release their connections."""
+        await self._client.aclose()
+        if self._session is not None:
+            await self._session.close()
+
+
+# Provider clients are process-wide singletons: every NewspaperPipeline (app,
+# tests, scripts) shares them and their connection pools. Keyed on the API
+# key so a changed key builds a new client. The LangChain SDKs are imported
+# here, so a provider without a key never pays its (~1 s) import.
+@functools.lru_cache(maxsize=1)
+def _get_deepseek_llm(api_key: str) -> DeepSeekLLM:
+    return DeepSeekLLM(api_key)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_openai_http_client() -> httpx.AsyncClient:
+    return _pooled_http_client(timeout=60.0)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_openai_llm(api_key: str) -> "ChatOpenAI":
+    import openai
+    from langchain_openai import ChatOpenAI
+
+    _add_provider_errors(openai.OpenAIError)
+    # max_tokens is passed per call via bind() so the HTTP pool stays shared.
+    # SDK retries are off: _ainvoke_text applies the shared retry policy.
+    return ChatOpenAI(
+        api_key=api_key,
+        model="gpt-4-turbo-preview",
+        temperature=0.7,
+        seed=LLM_SEED,
+        max_retries=0,
+        http_async_client=_get_openai_http_client(),
+    )
+
+
+@functools.lru_cache(maxsize=2)
+def _get_gemini_llm(api_key: str, model: str) -> "ChatGoogleGenerativeAI":
+    from google.api_core.exceptions import GoogleAPIError
+    from langchain_google_genai import ChatGoogleGenerativeAI
+    from langchain_google_genai.chat_models import ChatGoogleGenerativeAIError
+
+    _add_provider_errors(GoogleAPIError, ChatGoogleGenerativeAIError)
+    # One attempt only: the built-in retry also retries 404s, which must reach
+    # edit_stage's fallback quickly; _ainvoke_text retries real transients.
+    return ChatGoogleGenerativeAI(
+        model=model,
+        google_api_key=api_key,
+        temperature=0.5,
+        convert_system_message_to_human=True,
+        max_retries=1,
+    )
+
+
+async def aclose_shared_clients() -> None:
+    """Close the process-wide provider HTTP clients (call once at shutdown).
+
+    Every pipeline shares these clients, so no single pipeline closes them.
+    The factory caches are cleared so pipelines built afterwards start fresh.
+    """
+    if _get_openai_http_client.cache_info().currsize:
+        await _get_openai_http_client().aclose()
+    if settings.deepseek_api_key and _get_deepseek_llm.cache_info().currsize:
+        await _get_deepseek_llm(settings.deepseek_api_key).aclose()
+    _get_openai_llm.cache_clear()
+    _get_openai_http_client.cache_clear()
+    _get_deepseek_llm.cache_clear()
 
 
 class NewspaperPipeline:
-    """Orchestrates Research → Draft → Edit stages."""
+    """Orchestrates Research → Draft → Edit stages.
+
+    Cheap to construct: provider clients come from the shared factories above.
+    """
+
+    # One FACT/SOURCE pair per line, scanned in a single finditer pass.
+    _FACT_RE = re.compile(
+        r"FACT:\s*(.+?)\s*\|\s*SOURCE:\s*(.+?)\s*(?:\n|$)", re.MULTILINE
+    )
 
     def __init__(self) -> None:
-        self.deepseek_api_key = DEEPSEEK_API_KEY
-        self.openai_api_key = OPENAI_API_KEY
-        self.google_api_key = GOOGLE_API_KEY
+        self.deepseek_api_key = settings.deepseek_api_key
+        self.openai_api_key = settings.openai_api_key
+        self.google_api_key = settings.google_api_key
 
         if not self.deepseek_api_key:
             logger.warning("DEEPSEEK_API_KEY not set - Research stage unavailable")
@@ -121,32 +831,102 @@ class NewspaperPipeline:
             logger.warning("GOOGLE_API_KEY not set - Edit stage unavailable")
 
         self.deepseek_llm = (
-            DeepSeekLLM(self.deepseek_api_key) if self.deepseek_api_key else None
+            _get_deepseek_llm(self.deepseek_api_key) if self.deepseek_api_key else None
+        )
+        self._openai_http_client = (
+            _get_openai_http_client() if self.openai_api_key else None
         )
         self.openai_llm = (
-            ChatOpenAI(
-                api_key=self.openai_api_key,
-                model="gpt-4-turbo-preview",
-                temperature=0.7,
-            )
-            if self.openai_api_key
-            else None
+            _get_openai_llm(self.openai_api_key) if self.openai_api_key else None
         )
         self.gemini_edit_model = GEMINI_EDIT_MODEL
         self.gemini_edit_fallback_model = GEMINI_FALLBACK_MODEL
-        self.gemini_llm = (
-            ChatGoogleGenerativeAI(
-                model=self.gemini_edit_model,
-                google_api_key=self.google_api_key,
-                temperature=0.5,
-                convert_system_message_to_human=True,
-            )
-            if self.google_api_key
-            else None
+        self.gemini_llm = self._build_gemini_llm(self.gemini_edit_model)
+        self.gemini_fallback_llm = self._build_gemini_llm(
+            self.gemini_edit_fallback_model
         )
+        # Per-provider caps on in-flight calls across concurrent pipeline runs,
+        # so a burst on one provider cannot starve the others.
+        self._semaphores = {
+            "deepseek": asyncio.Semaphore(DEEPSEEK_MAX_CONC),
+            "openai": asyncio.Semaphore(OPENAI_MAX_CONC),
+            "gemini": asyncio.Semaphore(GEMINI_MAX_CONC),
+        }
+        self._llm_cache = create_llm_cache()
+        self._stage_cache = create_stage_cache()
+        self.cache_stats = {"hits": 0, "misses": 0}
+        # DeepSeek/OpenAI calls fail fast while their breaker is open; for
+        # Gemini the breaker routes edits to the fallback model instead.
+        self._breakers = {
+            name: CircuitBreaker(name) for name in ("deepseek", "openai", "gemini")
+        }
+
+    def _build_gemini_llm(self, model: str) -> Any:
+        """Create a Gemini chat client for ``model`` (None without an API key)."""
+        if not self.google_api_key:
+            return None
+        return _get_gemini_llm(self.google_api_key, model)
+
+    def _stage_model(self, stage: str) -> str:
+        """Model name the stage cache key is scoped to."""
+        if stage == "research":
+            return self.deepseek_llm.model if self.deepseek_llm else ""
+        if stage == "draft":
+            return self.openai_llm.model_name if self.openai_llm else ""
+        return self.gemini_edit_model
+
+    def _stage_cacheable(self, stage: str) -> bool:
+        """True if ``stage``'s model output is deterministic enough to cache."""
+        provider, llm = {
+            "research": ("deepseek", self.deepseek_llm),
+            "draft": ("openai", self.openai_llm),
+            "edit": ("gemini", self.gemini_llm),
+        }[stage]
+        temperature = llm.temperature if llm else 0.0
+        return is_cacheable(temperature, _provider_seed(provider))
+
+    async def _cached_generate(
+        self,
+        provider: str,
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        call: Callable[[], Awaitable[str]],
+        breaker: Optional[CircuitBreaker] = None,
+        refresh: bool = False,
+        **extra: Any,
+    ) -> str:
+        """Return a cached response for this request, or run ``call`` and cache it.
+
+        Cache misses run under ``provider``'s concurrency semaphore and, if
+        given, through ``breaker`` (raising CircuitOpenError while it is open).
+        ``refresh`` skips the lookup and overwrites the cached response.
+        """
+        semaphore = self._semaphores[provider]
+
+        async def locked_call() -> str:
+            async with semaphore:
+                return await call()
 
+        async def guarded_call() -> str:
+            return await (breaker.call(locked_call) if breaker else locked_call())
+
+        cache = self._llm_cache
+        seed = _provider_seed(provider)
+        if cache is None or not is_cacheable(temperature, seed):
+            return await guarded_call()
+        key = cache_key(model, messages, temperature, {"seed": seed, **extra})
+        cached = None if refresh else await cache.get(key)
+        if cached is not None:
+            logger.info("LLM cache hit (%s)", model)
+            return cached
+        text = await guarded_call()
+        await cache.set(key, text)
+        return text
+
+    @_stage_cached("research")
     async def research_stage(
-        self, topic: str, max_length: int = 1000
+        self, topic: str, max_length: int = 1000, refresh: bool = False
     ) -> Dict[str, Any]:
         if not self.deepseek_llm:
             logger.error("Research: DEEPSEEK_API_KEY not configured")
@@ -157,70 +937,148 @@ class NewspaperPipeline:
                 "research_facts": [],
             }
 
-        if max_length < 150:
-            fact_instruction = (
-                "Provide at most 3 facts. Very brief. One line per fact."
+        research_prompt = self._build_research_prompt(topic, max_length)
+        max_tokens = research_max_tokens(max_length)
+        try:
+            research_data = await self._cached_generate(
+                "deepseek",
+                self.deepseek_llm.model,
+                [{"role": "user", "content": research_prompt}],
+                self.deepseek_llm.temperature,
+                lambda: self.deepseek_llm.agenerate(research_prompt, max_tokens),
+                breaker=self._breakers["deepseek"],
+                refresh=refresh,
+                max_tokens=max_tokens,
             )
-        elif max_length <= 500:
-            fact_instruction = "Provide 5-7 facts. Concise."
-        else:
-            fact_instruction = "Provide 10-15 facts (full research)."
+            return self._research_result(research_data)
+        except _PROVIDER_ERRORS as e:
+            return self._research_error(e)
 
-        research_prompt = f'''Research the topic: "{topic}"
-
-{fact_instruction}
+    def _build_research_prompt(self, topic: str, max_length: int) -> str:
+        return _RESEARCH_PROMPT.format_map(
+            {
+                "topic": topic,
+                "fact_instruction": _prompt_flags(max_length)[0],
+                "max_length": max_length,
+            }
+        )
 
-For each finding, use this exact format on its own line:
-FACT: <the finding or statistic> | SOURCE: <source name, study, or citation>
+    def _research_result(self, research_data: str) -> Dict[str, Any]:
+        return {
+            "status": "success",
+            "message": "Research completed successfully",
+            "research_data": research_data,
+            "research_facts": self._parse_research_facts(research_data),
+            "llm_used": "DeepSeek Chat",
+        }
 
-Example:
-FACT: Global temperatures have risen 1.1°C since pre-industrial. | SOURCE: IPCC
-FACT: Renewable energy 30% of global electricity in 2024. | SOURCE: IEA
+    def _research_error(self, e: Exception) -> Dict[str, Any]:
+        error_msg = str(e) or "Unknown error occurred"
+        logger.exception("Research stage failed: %s", error_msg)
+        return {
+            "status": "error",
+            "message": f"Research failed: {error_msg}",
+            "research_data": f"Research stage encountered an error: {error_msg}",
+            "research_facts": [],
+        }
 
-Do not exceed facts requested. Keep concise for {max_length}-word article.'''
+    async def stream_research_stage(
+        self, topic: str, max_length: int = 1000
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream research as ``research_chunk`` events, then ``research_stage``."""
+        if not self.deepseek_llm:
+            result = await self.research_stage(topic, max_length)
+            yield {"event": "research_stage", "data": result}
+            return
 
+        research_prompt = self._build_research_prompt(topic, max_length)
+        breaker = self._breakers["deepseek"]
+        parts: List[str] = []
         try:
-            research_data = await self.deepseek_llm.agenerate(research_prompt)
-            research_facts = self._parse_research_facts(research_data)
-            return {
-                "status": "success",
-                "message": "Research completed successfully",
-                "research_data": research_data,
-                "research_facts": research_facts,
-                "llm_used": "DeepSeek Chat",
-            }
-        except Exception as e:
-            error_msg = str(e) or "Unknown error occurred"
-            logger.exception("Research stage failed: %s", error_msg)
-            return {
-                "status": "error",
-                "message": f"Research failed: {error_msg}",
-                "research_data": f"Research stage encountered an error: {error_msg}",
-                "research_facts": [],
-            }
+            if not breaker.allow():
+                raise CircuitOpenError("deepseek circuit open - call skipped")
+            async with self._semaphores["deepseek"]:
+                async for text in self.deepseek_llm.astream(
+                    research_prompt, research_max_tokens(max_length)
+                ):
+                    parts.append(text)
+                    yield {"event": "research_chunk", "data": text}
+            breaker.record_success()
+            result = self._research_result("".join(parts))
+        except _PROVIDER_ERRORS as e:
+            if is_provider_failure(e):
+                breaker.record_failure()
+            elif not isinstance(e, CircuitOpenError):
+                breaker.release()
+            result = self._research_error(e)
+        yield {"event": "research_stage", "data": result}
 
     def _parse_research_facts(self, research_data: str) -> List[Dict[str, str]]:
-        facts = []
-        for line in (research_data or "").strip().split("\n"):
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            if "FACT:" in line and "|" in line and "SOURCE:" in line:
-                try:
-                    fact_part, source_part = line.split("|", 1)
-                    fact = fact_part.replace("FACT:", "").strip()
-                    source = source_part.replace("SOURCE:", "").strip()
-                    if fact and source:
-                        facts.append({"fact": fact, "source": source})
-                except ValueError:
-                    facts.append({"fact": line, "source": "DeepSeek Research"})
-            elif line:
-                facts.append({"fact": line, "source": "DeepSeek Research"})
-        return facts
+        facts = [
+            {"fact": m.group(1), "source": m.group(2)}
+            for m in self._FACT_RE.finditer(research_data or "")
+        ]
+        if facts:
+            return facts
+        # Model ignored the FACT/SOURCE format: keep each line as a fact.
+        lines = (line.strip() for line in (research_data or "").splitlines())
+        return [
+            {"fact": line, "source": "DeepSeek Research"}
+            for line in lines
+            if line and not line.startswith("#")
+        ]
+
+    async def _build_draft_prompt(
+        self, topic: str, research_data: str, max_length: int
+    ) -> Tuple[str, int]:
+        """Return (draft prompt, max_tokens) for the requested article length.
 
+        Research boilerplate is stripped and the rest capped at
+        DRAFT_MAX_INPUT_TOKENS so long research does not inflate the prompt.
+        """
+        _, is_blurb, is_short, max_tokens = _prompt_flags(max_length)
+        research_data = await _trim_research(
+            research_data, self.openai_llm.model_name
+        )
+        if is_blurb:
+            draft_prompt = _DRAFT_BLURB_PROMPT.format_map(
+                {
+                    "topic": topic,
+                    "research_data": research_data,
+                    "max_length": max_length,
+                }
+            )
+        else:
+            concise_instruction = (
+                "\nCRITICAL: VERY CONCISE. NO FLUFF. Every sentence must earn "
+                "its place.\n"
+                if is_short
+                else ""
+            )
+            draft_prompt = _DRAFT_ARTICLE_PROMPT.format_map(
+                {
+                    "topic": topic,
+                    "concise_instruction": concise_instruction,
+                    "research_data": research_data,
+                    "max_length": max_length,
+                }
+            )
+        return draft_prompt, max_tokens
+
+    @_stage_cached("draft")
     async def draft_stage(
-        self, topic: str, research_data: str, max_length: int = 1200
+        self,
+        topic: str,
+        research_data: str,
+        max_length: int = 1200,
+        n_drafts: int = 1,
+        refresh: bool = False,
     ) -> Dict[str, Any]:
+        """Write the article draft from research data.
+
+        With ``n_drafts`` > 1 the candidates are generated concurrently; the
+        first is returned as ``draft_content`` and all appear under ``drafts``.
+        """
         if not self.openai_llm:
             logger.error("Draft: OPENAI_API_KEY not configured")
             return {
@@ -229,65 +1087,100 @@ Do not exceed facts requested. Keep concise for {max_length}-word article.'''
                 "draft_content": "Draft stage unavailable",
             }
 
-        is_blurb = max_length < 150
-        is_short = max_length < 200 and not is_blurb
-        max_tokens = word_count_to_max_tokens(max_length)
-        if is_blurb:
-            draft_prompt = (
-                f'''Based on this research, write a VERY BRIEF news blurb of '''
-                f'''exactly {max_length} words about "{topic}".
+        draft_prompt, max_tokens = await self._build_draft_prompt(
+            topic, research_data, max_length
+        )
 
-Research Data:
-{research_data}
+        seed = _provider_seed("openai")
 
-Requirements:
-- Write a VERY BRIEF news blurb of exactly {max_length} words.
-- Just 2-3 key points. No introduction or conclusion needed.
-- One short paragraph is fine. Be direct.
-- Use FACT: ... | SOURCE: ... only as background; write the blurb in normal prose.
-'''
+        def generate(i: int) -> Awaitable[str]:
+            # With a pinned seed every candidate would come back the same, so
+            # each extra draft samples with its own seed.
+            bind_kwargs: Dict[str, Any] = {"max_tokens": max_tokens}
+            if i and seed is not None:
+                bind_kwargs["seed"] = seed + i
+            draft_llm = self.openai_llm.bind(**bind_kwargs)
+            return self._cached_generate(
+                "openai",
+                self.openai_llm.model_name,
+                [{"role": "user", "content": draft_prompt}],
+                self.openai_llm.temperature,
+                lambda: _ainvoke_text(draft_llm, draft_prompt),
+                breaker=self._breakers["openai"],
+                refresh=refresh,
+                max_tokens=max_tokens,
+                **({"draft_index": i} if i else {}),
             )
-        else:
-            concise_instruction = (
-                "\nCRITICAL: VERY CONCISE. NO FLUFF. Every sentence must earn "
-                "its place.\n"
-                if is_short
-                else ""
+
+        try:
+            contents = await asyncio.gather(
+                *(generate(i) for i in range(max(1, n_drafts)))
             )
-            draft_prompt = f'''
-Based on the research below, write a compelling newspaper article about "{topic}".
-{concise_instruction}
-Research Data:
-{research_data}
+            drafts = [await _finalize_text(c, max_length) for c in contents]
+            draft_content, final_words = drafts[0]
+            result = {
+                "status": "success",
+                "message": "Draft generated successfully",
+                "draft_content": draft_content,
+                "llm_used": "OpenAI GPT-4 Turbo",
+                "word_count": final_words,
+                "target_word_count": max_length,
+            }
+            if n_drafts > 1:
+                result["drafts"] = [
+                    {"draft_content": content, "word_count": words}
+                    for content, words in drafts
+                ]
+            return result
+        except _PROVIDER_ERRORS as e:
+            logger.exception("Draft stage failed: %s", e)
+            return {
+                "status": "error",
+                "message": f"Draft generation failed: {str(e)}",
+                "draft_content": "Draft stage encountered an error",
+            }
 
-Requirements:
-- Write in a professional journalistic style
-- Include a compelling headline
-- Structure with clear paragraphs
-- Include relevant facts and context
-- Maintain objectivity and accuracy
-- Target length: approximately {max_length} words (strict limit)
-- Use proper news article formatting
+    async def stream_draft_stage(
+        self, topic: str, research_data: str, max_length: int = 1200
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream the draft as ``draft_chunk`` events, then yield ``draft_stage``.
 
-Provide the complete article draft. Do not exceed {max_length} words.
-'''
+        A running word estimate is kept per chunk; once it passes 120% of
+        ``max_length`` the provider stream is closed early, since the extra
+        text would be truncated anyway.
+        """
+        if not self.openai_llm:
+            result = await self.draft_stage(topic, research_data, max_length)
+            yield {"event": "draft_stage", "data": result}
+            return
 
+        draft_prompt, max_tokens = await self._build_draft_prompt(
+            topic, research_data, max_length
+        )
+        limit = int(max_length * 1.2)
+        breaker = self._breakers["openai"]
+        parts: List[str] = []
+        word_estimate = 0
         try:
-            draft_llm = ChatOpenAI(
-                api_key=self.openai_api_key,
-                model="gpt-4-turbo-preview",
-                temperature=0.7,
-                max_tokens=max_tokens,
+            if not breaker.allow():
+                raise CircuitOpenError("openai circuit open - call skipped")
+            draft_llm = self.openai_llm.bind(max_tokens=max_tokens)
+            async with self._semaphores["openai"]:
+                async for chunk in draft_llm.astream(draft_prompt):
+                    text = chunk.content if hasattr(chunk, "content") else str(chunk)
+                    if not text:
+                        continue
+                    parts.append(text)
+                    yield {"event": "draft_chunk", "data": text}
+                    word_estimate += _word_count_fast(text) - 1
+                    if word_estimate > limit:
+                        logger.info("Draft: stopping stream at ~%d words", limit)
+                        break
+            breaker.record_success()
+            draft_content, final_words = await _finalize_text(
+                "".join(parts), max_length
             )
-            response = await draft_llm.ainvoke(draft_prompt)
-            draft_content = (
-                response.content
-                if hasattr(response, "content")
-                else str(response)
-            )
-            draft_content = _truncate_to_word_count(draft_content, max_length)
-            final_words = _count_words(draft_content)
-            return {
+            result = {
                 "status": "success",
                 "message": "Draft generated successfully",
                 "draft_content": draft_content,
@@ -295,17 +1188,33 @@ Provide the complete article draft. Do not exceed {max_length} words.
                 "word_count": final_words,
                 "target_word_count": max_length,
             }
-        except Exception as e:
+        except _PROVIDER_ERRORS as e:
+            if is_provider_failure(e):
+                breaker.record_failure()
+            elif not isinstance(e, CircuitOpenError):
+                breaker.release()
             logger.exception("Draft stage failed: %s", e)
-            return {
+            result = {
                 "status": "error",
                 "message": f"Draft generation failed: {str(e)}",
                 "draft_content": "Draft stage encountered an error",
             }
+        yield {"event": "draft_stage", "data": result}
 
+    @_stage_cached("edit")
     async def edit_stage(
-        self, topic: str, draft_content: str, max_length: int = 1200
+        self,
+        topic: str,
+        draft_content: str,
+        max_length: int = 1200,
+        segment: bool = False,
+        refresh: bool = False,
     ) -> Dict[str, Any]:
+        """Polish the draft with Gemini, falling back to the fallback model.
+
+        ``segment`` edits one section of a longer draft: the existing headline
+        is kept and no new headings are added.
+        """
         if not self.gemini_llm:
             logger.error("Edit: GOOGLE_API_KEY not configured")
             return {
@@ -314,144 +1223,418 @@ Provide the complete article draft. Do not exceed {max_length} words.
                 "final_content": "Edit stage unavailable",
             }
 
-        is_short = max_length < 200
+        messages, max_output_tokens = self._build_edit_messages(
+            topic, draft_content, max_length, segment
+        )
+        breaker = self._breakers["gemini"]
+        if breaker.allow():
+            try:
+                final_content = await self._cached_generate(
+                    "gemini",
+                    self.gemini_edit_model,
+                    _message_dicts(messages),
+                    self.gemini_llm.temperature,
+                    lambda: _ainvoke_text(
+                        self.gemini_llm, messages, max_output_tokens=max_output_tokens
+                    ),
+                    refresh=refresh,
+                    max_tokens=max_output_tokens,
+                )
+                breaker.record_success()
+                return await self._edit_result(
+                    final_content, self.gemini_edit_model, max_length
+                )
+            except _PROVIDER_ERRORS as e:
+                _record_gemini_outcome(breaker, e)
+                if not _is_model_not_found(e):
+                    logger.exception("Edit stage failed: %s", e)
+                    return {
+                        "status": "error",
+                        "message": f"Editing failed: {str(e)}",
+                        "final_content": "Edit stage encountered an error",
+                    }
+                logger.warning(
+                    "Edit: %s unavailable, trying fallback %s",
+                    self.gemini_edit_model,
+                    self.gemini_edit_fallback_model,
+                )
+        else:
+            logger.warning(
+                "Edit: circuit open for %s, using fallback %s",
+                self.gemini_edit_model,
+                self.gemini_edit_fallback_model,
+            )
+
+        try:
+            fallback_llm = self.gemini_fallback_llm
+            final_content = await self._cached_generate(
+                "gemini",
+                self.gemini_edit_fallback_model,
+                _message_dicts(messages),
+                fallback_llm.temperature,
+                lambda: _ainvoke_text(
+                    fallback_llm, messages, max_output_tokens=max_output_tokens
+                ),
+                refresh=refresh,
+                max_tokens=max_output_tokens,
+            )
+            return await self._edit_result(
+                final_content, self.gemini_edit_fallback_model, max_length
+            )
+        except _PROVIDER_ERRORS as fallback_e:
+            logger.exception("Edit stage failed (fallback): %s", fallback_e)
+            return {
+                "status": "error",
+                "message": f"Editing failed: {str(fallback_e)}",
+                "final_content": "Edit stage encountered an error",
+            }
+
+    def _build_edit_messages(
+        self, topic: str, draft_content: str, max_length: int, segment: bool = False
+    ) -> Tuple[List[BaseMessage], int]:
+        """Return the Gemini edit messages and the output token budget."""
+        _, is_blurb, is_short, max_output_tokens = _prompt_flags(max_length)
         concise_instruction = (
             " CRITICAL: VERY CONCISE. NO FLUFF. Do not add length."
-            if is_short
+            if is_blurb or is_short
             else ""
         )
-        max_output_tokens = word_count_to_max_tokens(max_length)
-        edit_prompt = f'''
-As an experienced editor, review and polish the following article about "{topic}":
-{concise_instruction}
+        template = _EDIT_SEGMENT_TEMPLATE if segment else _EDIT_TEMPLATE
+        messages = template.format_messages(
+            topic=topic,
+            concise_instruction=concise_instruction,
+            draft_content=draft_content,
+            max_length=max_length,
+        )
+        return messages, max_output_tokens
 
-{draft_content}
+    async def stream_edit_stage(
+        self, topic: str, draft_content: str, max_length: int = 1200
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream the edit as ``final_chunk`` events, then yield ``final_stage``.
 
-Please:
-1. Improve clarity and flow
-2. Enhance readability and engagement
-3. Ensure proper grammar and style
-4. Optimize headline for impact
-5. Add compelling subheadings if needed (only if length allows)
-6. Maintain journalistic integrity
-7. Ensure the article is publication-ready
+        Uses the primary Gemini model unless its breaker is open; a 404 before
+        any text arrived retries on the fallback model, as in ``edit_stage``.
+        """
+        if not self.gemini_llm:
+            result = await self.edit_stage(topic, draft_content, max_length)
+            yield {"event": "final_stage", "data": result}
+            return
 
-Provide the final polished version. Keep length ~{max_length} words max.
-'''
+        messages, max_output_tokens = self._build_edit_messages(
+            topic, draft_content, max_length
+        )
+        breaker = self._breakers["gemini"]
+        candidates = [(self.gemini_fallback_llm, self.gemini_edit_fallback_model)]
+        if breaker.allow():
+            candidates.insert(0, (self.gemini_llm, self.gemini_edit_model))
+        result: Dict[str, Any] = {}
+        for llm, model in candidates:
+            parts: List[str] = []
+            try:
+                async with self._semaphores["gemini"]:
+                    async for chunk in llm.astream(
+                        messages, max_output_tokens=max_output_tokens
+                    ):
+                        text = chunk.content if hasattr(chunk, "content") else ""
+                        if text:
+                            parts.append(text)
+                            yield {"event": "final_chunk", "data": text}
+                if llm is self.gemini_llm:
+                    breaker.record_success()
+                result = await self._edit_result("".join(parts), model, max_length)
+                break
+            except _PROVIDER_ERRORS as e:
+                if llm is self.gemini_llm:
+                    _record_gemini_outcome(breaker, e)
+                result = {
+                    "status": "error",
+                    "message": f"Editing failed: {str(e)}",
+                    "final_content": "Edit stage encountered an error",
+                }
+                if parts or not _is_model_not_found(e):
+                    logger.exception("Edit stage failed: %s", e)
+                    break
+                logger.warning("Edit: %s unavailable, trying fallback", model)
+        yield {"event": "final_stage", "data": result}
 
-        messages = [
-            SystemMessage(
-                content=(
-                    "You are an experienced newspaper editor with expertise "
-                    "in polishing journalistic content."
-                )
-            ),
-            HumanMessage(content=edit_prompt),
-        ]
+    async def _edit_result(
+        self, final_content: str, model: str, max_length: int
+    ) -> Dict[str, Any]:
+        """Truncate edited text and build the success result for ``model``."""
+        final_content, final_words = await _finalize_text(final_content, max_length)
+        return {
+            "status": "success",
+            "message": "Article polished successfully",
+            "final_content": final_content,
+            "llm_used": f"Google Gemini ({model})",
+            "word_count": final_words,
+            "target_word_count": max_length,
+        }
+
+    async def fused_research_draft_stage(
+        self, topic: str, max_length: int = 1000
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Research and draft in a single OpenAI call (short articles only).
 
+        Saves the DeepSeek round trip and the hand-off between providers.
+        Returns (research_result, draft_result) shaped like the separate stages.
+        """
+        fact_instruction, _, _, max_tokens = _prompt_flags(max_length)
+        max_tokens += 300
+        prompt = _FUSED_PROMPT.format_map(
+            {
+                "topic": topic,
+                "fact_instruction": fact_instruction,
+                "max_length": max_length,
+            }
+        )
         try:
-            edit_llm = ChatGoogleGenerativeAI(
-                model=self.gemini_edit_model,
-                google_api_key=self.google_api_key,
-                temperature=0.5,
-                max_output_tokens=max_output_tokens,
-                convert_system_message_to_human=True,
-            )
-            response = await edit_llm.ainvoke(messages)
-            final_content = (
-                response.content
-                if hasattr(response, "content")
-                else str(response)
+            llm = self.openai_llm.bind(max_tokens=max_tokens)
+            text = await self._cached_generate(
+                "openai",
+                self.openai_llm.model_name,
+                [{"role": "user", "content": prompt}],
+                self.openai_llm.temperature,
+                lambda: _ainvoke_text(llm, prompt),
+                breaker=self._breakers["openai"],
+                max_tokens=max_tokens,
             )
-            final_content = _truncate_to_word_count(final_content, max_length)
-            final_words = _count_words(final_content)
-            return {
-                "status": "success",
-                "message": "Article polished successfully",
-                "final_content": final_content,
-                "llm_used": f"Google Gemini ({self.gemini_edit_model})",
-                "word_count": final_words,
-                "target_word_count": max_length,
+        except _PROVIDER_ERRORS as e:
+            logger.exception("Fused research/draft failed: %s", e)
+            research_result = {
+                "status": "error",
+                "message": f"Research failed: {str(e)}",
+                "research_data": f"Research stage encountered an error: {str(e)}",
+                "research_facts": [],
             }
-        except Exception as e:
-            if "not found" in str(e).lower() or "404" in str(e):
-                logger.warning(
-                    "Edit: %s unavailable, trying fallback %s",
-                    self.gemini_edit_model,
-                    self.gemini_edit_fallback_model,
-                )
-                try:
-                    fallback_llm = ChatGoogleGenerativeAI(
-                        model=self.gemini_edit_fallback_model,
-                        google_api_key=self.google_api_key,
-                        temperature=0.5,
-                        max_output_tokens=max_output_tokens,
-                        convert_system_message_to_human=True,
-                    )
-                    response = await fallback_llm.ainvoke(messages)
-                    final_content = (
-                        response.content
-                        if hasattr(response, "content")
-                        else str(response)
-                    )
-                    final_content = _truncate_to_word_count(
-                        final_content, max_length
-                    )
-                    final_words = _count_words(final_content)
-                    fallback_llm_name = (
-                        f"Google Gemini ({self.gemini_edit_fallback_model})"
-                    )
-                    return {
-                        "status": "success",
-                        "message": "Article polished successfully",
-                        "final_content": final_content,
-                        "llm_used": fallback_llm_name,
-                        "word_count": final_words,
-                        "target_word_count": max_length,
-                    }
-                except Exception as fallback_e:
-                    logger.exception("Edit stage failed (fallback): %s", fallback_e)
-                    return {
-                        "status": "error",
-                        "message": f"Editing failed: {str(fallback_e)}",
-                        "final_content": "Edit stage encountered an error",
-                    }
-            logger.exception("Edit stage failed: %s", e)
-            return {
+            return research_result, dict(_DRAFT_SKIPPED)
+
+        research_data, _, draft_content = text.partition("ARTICLE:")
+        research_data = research_data.strip()
+        draft_content, final_words = await _finalize_text(
+            draft_content.strip(), max_length
+        )
+        research_result = {
+            "status": "success",
+            "message": "Research completed successfully",
+            "research_data": research_data,
+            "research_facts": self._parse_research_facts(research_data),
+            "llm_used": "OpenAI GPT-4 Turbo (fused with draft)",
+        }
+        if not draft_content:
+            return research_result, {
                 "status": "error",
-                "message": f"Editing failed: {str(e)}",
-                "final_content": "Edit stage encountered an error",
+                "message": "Draft generation failed: no ARTICLE section in response",
+                "draft_content": "Draft stage encountered an error",
             }
+        draft_result = {
+            "status": "success",
+            "message": "Draft generated successfully",
+            "draft_content": draft_content,
+            "llm_used": "OpenAI GPT-4 Turbo",
+            "word_count": final_words,
+            "target_word_count": max_length,
+        }
+        return research_result, draft_result
+
+    async def overlapped_draft_edit_stage(
+        self, topic: str, research_data: str, max_length: int = 1000
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Stream the draft and edit it segment by segment as it arrives.
+
+        The draft producer puts paragraph-aligned segments of about
+        ``_OVERLAP_SEGMENT_WORDS`` words on a queue; each segment is edited as
+        soon as it is queued, so editing overlaps the rest of the draft. The
+        polished segments are joined in order. Returns (draft_result,
+        edit_result) shaped like the separate stages.
+        """
+        queue: "asyncio.Queue[Any]" = asyncio.Queue()
+        draft_result: Dict[str, Any] = dict(_DRAFT_SKIPPED)
+
+        async def produce() -> None:
+            nonlocal draft_result
+            buffer = ""
+            try:
+                async for event in self.stream_draft_stage(
+                    topic, research_data, max_length
+                ):
+                    if event["event"] == "draft_stage":
+                        draft_result = event["data"]
+                        continue
+                    buffer += event["data"]
+                    head, sep, tail = buffer.rpartition("\n\n")
+                    if sep and _word_count_fast(head) > _OVERLAP_SEGMENT_WORDS:
+                        await queue.put(head)
+                        buffer = tail
+                if buffer.strip() and draft_result["status"] == "success":
+                    await queue.put(buffer)
+            finally:
+                await queue.put(None)
+
+        producer = asyncio.create_task(produce())
+        edits: List[asyncio.Task] = []
+        try:
+            while (segment := await queue.get()) is not None:
+                edits.append(
+                    asyncio.create_task(
+                        self.edit_stage(
+                            topic,
+                            segment.strip(),
+                            max(50, _count_words(segment)),
+                            segment=True,
+                        )
+                    )
+                )
+            await producer
+        except BaseException:
+            producer.cancel()
+            for task in edits:
+                task.cancel()
+            raise
+
+        if draft_result["status"] != "success":
+            for task in edits:
+                task.cancel()
+            return draft_result, dict(_EDIT_SKIPPED)
+        if not edits:
+            # Blank draft: no segment was queued, so edit it as the serial path would.
+            return draft_result, await self.edit_stage(
+                topic, draft_result["draft_content"], max_length
+            )
+
+        segments = await asyncio.gather(*edits)
+        failed = next((r for r in segments if r["status"] != "success"), None)
+        if failed is not None:
+            return draft_result, failed
+        final_content, final_words = await _finalize_text(
+            "\n\n".join(r["final_content"] for r in segments), max_length
+        )
+        return draft_result, {
+            "status": "success",
+            "message": "Article polished successfully",
+            "final_content": final_content,
+            "llm_used": segments[0]["llm_used"],
+            "word_count": final_words,
+            "target_word_count": max_length,
+        }
 
     async def run_pipeline(
         self, topic: str, max_length: int = 1000
     ) -> Dict[str, Any]:
-        research_result = await self.research_stage(topic, max_length)
-
-        if research_result["status"] == "success":
-            draft_result = await self.draft_stage(
-                topic, research_result["research_data"], max_length
+        edit_result: Optional[Dict[str, Any]] = None
+        if self.openai_llm and max_length <= FUSED_RESEARCH_MAX_WORDS:
+            research_result, draft_result = await self.fused_research_draft_stage(
+                topic, max_length
             )
         else:
-            draft_result = {
-                "status": "skipped",
-                "message": "Draft stage skipped due to research failure",
-                "draft_content": "Cannot generate draft without research data",
-            }
+            research_result = await self.research_stage(topic, max_length)
+            if research_result["status"] != "success":
+                draft_result = dict(_DRAFT_SKIPPED)
+            elif DRAFT_EDIT_OVERLAP and self.openai_llm and self.gemini_llm:
+                draft_result, edit_result = await self.overlapped_draft_edit_stage(
+                    topic, research_result["research_data"], max_length
+                )
+            else:
+                draft_result = await self.draft_stage(
+                    topic, research_result["research_data"], max_length
+                )
 
-        if draft_result["status"] == "success":
+        if edit_result is None and draft_result["status"] == "success":
             edit_result = await self.edit_stage(
                 topic, draft_result["draft_content"], max_length
             )
-        else:
-            edit_result = {
-                "status": "skipped",
-                "message": "Edit stage skipped due to draft failure",
-                "final_content": "Cannot edit without draft content",
-            }
+        elif edit_result is None:
+            edit_result = dict(_EDIT_SKIPPED)
 
         return {
             "research_stage": research_result,
             "draft_stage": draft_result,
             "final_stage": edit_result,
         }
+
+    async def stream_pipeline(
+        self, topic: str, max_length: int = 1000
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Run the pipeline, yielding each stage result and draft text as it arrives.
+
+        Events are dicts with ``event`` (research_chunk, research_stage,
+        draft_chunk, draft_stage, final_chunk, final_stage) and ``data``;
+        ``*_chunk`` events carry incremental text.
+        """
+        research_result: Dict[str, Any] = {}
+        async for event in self.stream_research_stage(topic, max_length):
+            if event["event"] == "research_stage":
+                research_result = event["data"]
+            yield event
+
+        draft_result = dict(_DRAFT_SKIPPED)
+        if research_result["status"] == "success":
+            async for event in self.stream_draft_stage(
+                topic, research_result["research_data"], max_length
+            ):
+                if event["event"] == "draft_stage":
+                    draft_result = event["data"]
+                yield event
+        else:
+            yield {"event": "draft_stage", "data": draft_result}
+
+        if draft_result["status"] == "success":
+            async for event in self.stream_edit_stage(
+                topic, draft_result["draft_content"], max_length
+            ):
+                yield event
+        else:
+            yield {"event": "final_stage", "data": dict(_EDIT_SKIPPED)}
+
+    async def run_pipeline_batch(
+        self, topics: List[Union[str, Tuple[str, int]]]
+    ) -> List[Any]:
+        """Run the full pipeline for several topics concurrently.
+
+        Items are topic strings (default length) or (topic, max_length) pairs.
+        All runs are scheduled before awaiting, so wall-clock time tends toward
+        the slowest single run; each provider's load is bounded by its
+        semaphore. Failed runs are returned as exception objects in input order.
+        """
+        pairs = [(t, 1000) if isinstance(t, str) else t for t in topics]
+        tasks = [self.run_pipeline(topic, max_length) for topic, max_length in pairs]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _warmup_provider(self, provider: str) -> None:
+        """Open a connection to ``provider`` so the first real call skips DNS/TLS.
+
+        DeepSeek and OpenAI get a GET /models on their pooled HTTP client; any
+        status is fine. Gemini (gRPC) gets a 1-token completion.
+        """
+        if provider == "deepseek" and self.deepseek_llm:
+            await self.deepseek_llm.warmup()
+        elif provider == "openai" and self._openai_http_client:
+            base_url = self.openai_llm.openai_api_base or "https://api.openai.com/v1"
+            await self._openai_http_client.get(base_url.rstrip("/") + "/models")
+        elif provider == "gemini" and self.gemini_llm:
+            await self.gemini_llm.ainvoke("ping", max_output_tokens=1)
+        else:
+            return
+        logger.info("Warmed up %s connection", provider)
+
+    async def _warmup_tokenizer(self) -> None:
+        """Load the draft model's tiktoken encoding in a worker thread."""
+        if self.openai_llm:
+            await asyncio.to_thread(_token_encoding, self.openai_llm.model_name)
+
+    async def warmup(self) -> None:
+        """Warm all configured providers concurrently; failures are only logged.
+
+        The draft tokenizer is loaded alongside, so its one-off download does
+        not land on the first request.
+        """
+        providers = ("deepseek", "openai", "gemini")
+        results = await asyncio.gather(
+            *(self._warmup_provider(p) for p in providers),
+            self._warmup_tokenizer(),
+            return_exceptions=True,
+        )
+        for provider, result in zip(providers, results):
+            if isinstance(result, Exception):
+                logger.warning("Warm-up for %s failed: %s", provider, result)
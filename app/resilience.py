@@ -0,0 +1,194 @@
+"""
+Retry and circuit-breaker helpers for LLM provider calls.
+
+Transient failures (timeouts, connection errors, HTTP 429/5xx) are retried
+with jittered exponential backoff, honoring Retry-After. This covers httpx
+(DeepSeek), the OpenAI SDK and google-api-core (Gemini) errors. A
+per-provider circuit breaker stops sending traffic to a provider that keeps
+failing.
+
+The SDKs are not imported here: an SDK's errors can only be raised once
+something has imported it, so their classes are looked up in sys.modules.
+"""
+
+import logging
+import sys
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, Optional, TypeVar
+
+import httpx
+from tenacity import RetryCallState, wait_random_exponential
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+RETRY_ATTEMPTS = 4
+# Longest sleep between attempts, Retry-After included: retries run while the
+# caller holds its provider's concurrency slot.
+RETRY_MAX_WAIT = 10.0
+_backoff = wait_random_exponential(multiplier=1, max=RETRY_MAX_WAIT)
+
+
+def _is_retryable_status(status: object) -> bool:
+    return isinstance(status, int) and (status == 429 or status >= 500)
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """True for timeouts, transport errors, 429 and 5xx; other 4xx are final."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return _is_retryable_status(exc.response.status_code)
+    openai = sys.modules.get("openai")
+    if openai is not None:
+        if isinstance(exc, openai.APIStatusError):
+            return _is_retryable_status(exc.status_code)
+        if isinstance(exc, openai.APIConnectionError):
+            return True
+    google_errors = sys.modules.get("google.api_core.exceptions")
+    if google_errors is not None and isinstance(exc, google_errors.GoogleAPICallError):
+        return _is_retryable_status(exc.code)
+    return isinstance(exc, httpx.TransportError)
+
+
+def is_provider_failure(exc: BaseException) -> bool:
+    """True if ``exc``, or the error it was raised from, is retryable.
+
+    Only these count against a circuit breaker: a 400/401 or a ValueError is
+    specific to one request and must not cut the provider off for everyone.
+    """
+    cause = exc.__cause__
+    return is_retryable(exc) or (cause is not None and is_retryable(cause))
+
+
+def _retry_after_seconds(exc: BaseException) -> float:
+    """Return the Retry-After delay from an HTTP error response, or 0.
+
+    Covers httpx.HTTPStatusError and openai.APIStatusError, which both carry
+    the httpx response.
+    """
+    response = getattr(exc, "response", None)
+    if not isinstance(response, httpx.Response):
+        return 0.0
+    try:
+        return float(response.headers.get("Retry-After", 0))
+    except ValueError:
+        return 0.0
+
+
+def wait_retry_after(retry_state: RetryCallState) -> float:
+    """Tenacity wait: Retry-After if the provider sent one, else backoff + jitter.
+
+    Capped at RETRY_MAX_WAIT so a long Retry-After cannot stall the provider.
+    """
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    delay = min(max(_retry_after_seconds(exc), _backoff(retry_state)), RETRY_MAX_WAIT)
+    logger.warning(
+        "Retrying after %s (attempt %d) in %.1fs",
+        type(exc).__name__,
+        retry_state.attempt_number,
+        delay,
+    )
+    return delay
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a provider whose circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker for one provider.
+
+    Opens once ``failure_threshold`` provider failures (see
+    ``is_provider_failure``) fall within the last ``window`` seconds. After
+    ``recovery_timeout`` seconds it half-opens and ``allow()`` admits a single
+    trial call, rejecting everyone else until the trial's outcome closes or
+    re-opens the breaker. A trial that never reports back (e.g. cancelled)
+    is given up after another ``recovery_timeout``.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        window: float = 30.0,
+    ) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.window = window
+        self._failures: Deque[float] = deque()
+        self._opened_at = 0.0
+        self._state = self.CLOSED
+        self._trial_started_at: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        if (
+            self._state == self.OPEN
+            and time.monotonic() - self._opened_at >= self.recovery_timeout
+        ):
+            self._state = self.HALF_OPEN
+            self._trial_started_at = None
+        return self._state
+
+    def allow(self) -> bool:
+        """Return True if a call may be attempted now.
+
+        In the half-open state only the first caller gets True; that call
+        must then report ``record_success``, ``record_failure`` or ``release``.
+        """
+        state = self.state
+        if state != self.HALF_OPEN:
+            return state == self.CLOSED
+        now = time.monotonic()
+        if (
+            self._trial_started_at is not None
+            and now - self._trial_started_at < self.recovery_timeout
+        ):
+            return False
+        self._trial_started_at = now
+        return True
+
+    def release(self) -> None:
+        """End a trial call whose outcome says nothing about the provider."""
+        self._trial_started_at = None
+
+    def record_success(self) -> None:
+        self._trial_started_at = None
+        if self.state == self.HALF_OPEN:
+            self._failures.clear()
+            self._state = self.CLOSED
+
+    def record_failure(self) -> None:
+        self._trial_started_at = None
+        now = time.monotonic()
+        self._failures.append(now)
+        while now - self._failures[0] > self.window:
+            self._failures.popleft()
+        tripped = len(self._failures) >= self.failure_threshold
+        if self.state == self.HALF_OPEN or tripped:
+            if self._state != self.OPEN:
+                logger.warning("Circuit breaker for %s opened", self.name)
+            self._state = self.OPEN
+            self._opened_at = now
+
+    async def call(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run ``fn`` unless the breaker is open, recording the outcome."""
+        if not self.allow():
+            raise CircuitOpenError(f"{self.name} circuit open - call skipped")
+        try:
+            result = await fn()
+        except Exception as e:
+            if is_provider_failure(e):
+                self.record_failure()
+            else:
+                self.release()
+            raise
+        self.record_success()
+        return result
@@ -8,10 +8,10 @@ import os
 import sys
 from pathlib import Path
 
-from dotenv import load_dotenv
+from app.config import APP_HOST, APP_PORT, APP_WORKERS, DEBUG, load_env, settings
 
 _PROJECT_ROOT = Path(__file__).resolve().parent
-load_dotenv(_PROJECT_ROOT / ".env")
+load_env()
 
 REQUIRED_KEYS = ("OPENAI_API_KEY", "DEEPSEEK_API_KEY", "GOOGLE_API_KEY")
 
@@ -23,7 +23,7 @@ def check_env() -> tuple[bool, str]:
         return False, (
             "No .env file found. Copy .env.example to .env and add your API keys."
         )
-    missing = [k for k in REQUIRED_KEYS if not os.getenv(k)]
+    missing = [k for k in REQUIRED_KEYS if not getattr(settings, k.lower())]
     if missing:
         return False, f"Missing in .env: {', '.join(missing)}"
     return True, "Environment configured"
@@ -52,16 +52,23 @@ def main() -> None:
         print("  pip install -r requirements.txt")
         sys.exit(1)
 
-    print("  Starting server at http://localhost:8000")
+    print(f"  Starting server at http://localhost:{APP_PORT}")
+    if DEBUG:
+        print("  DEBUG: auto-reload on, single process")
+    else:
+        print(f"  Workers: {APP_WORKERS} (APP_WORKERS; CPUs: {os.cpu_count()})")
     print("  Press Ctrl+C to stop")
     print("=" * 50)
 
     try:
+        # uvicorn's default loop="auto"/http="auto" already pick uvloop and
+        # httptools when installed (uvicorn[standard]).
         uvicorn.run(
             "app.main:app",
-            host=os.getenv("APP_HOST", "0.0.0.0"),
-            port=int(os.getenv("APP_PORT", "8000")),
-            reload=os.getenv("DEBUG", "false").lower() in ("true", "1", "yes"),
+            host=APP_HOST,
+            port=APP_PORT,
+            reload=DEBUG,
+            workers=None if DEBUG else APP_WORKERS,
             log_level="info",
         )
     except KeyboardInterrupt:
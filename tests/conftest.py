@@ -4,21 +4,85 @@ Ensures project root is on sys.path so tests can import app.config,
 app.pipeline, etc.
 """
 
-import os
+import asyncio
 import sys
+from pathlib import Path
+from types import SimpleNamespace
 
-from dotenv import load_dotenv
+import pytest
 
-# Resolve project root: conftest.py lives in tests/, so parent is project root.
-# This makes "app" importable regardless of cwd.
-# (e.g. when CI runs pytest from repo root).
-_current_file = os.path.realpath(__file__)
-_conftest_dir = os.path.dirname(_current_file)
-_project_root = os.path.dirname(_conftest_dir)
+# conftest.py lives in tests/, so the parent is the project root. pytest.ini's
+# "pythonpath = ." covers runs from the root; this covers any other cwd.
+_PROJECT_ROOT = str(Path(__file__).resolve().parents[1])
 
-if _project_root not in sys.path:
-    sys.path.insert(0, _project_root)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 
-# Load .env so app.config and pipeline see API keys when present
-_env_path = os.path.join(_project_root, ".env")
-load_dotenv(_env_path)
+# .env is loaded once by app.config when tests import the app.
+
+
+class FakeChatLLM:
+    """Stand-in for ChatOpenAI; ``bind()`` returns the same object.
+
+    ``ainvoke`` returns the next of ``replies`` (raising it if it is an
+    exception). ``astream`` yields ``chunks`` and counts them in ``streamed``;
+    ``bound`` records the keyword arguments of every ``bind()`` call.
+    """
+
+    model_name = "fake"
+
+    def __init__(self, replies=(), chunks=(), temperature=0.7):
+        self.temperature = temperature
+        self._replies = iter(replies)
+        self._chunks = chunks
+        self.streamed = 0
+        self.bound = []
+
+    def bind(self, **kwargs):
+        self.bound.append(kwargs)
+        return self
+
+    async def ainvoke(self, prompt, **kwargs):
+        reply = next(self._replies)
+        if isinstance(reply, BaseException):
+            raise reply
+        return SimpleNamespace(content=reply)
+
+    async def astream(self, prompt, **kwargs):
+        for text in self._chunks:
+            self.streamed += 1
+            yield SimpleNamespace(content=text)
+
+
+@pytest.fixture
+def fake_chat_llm():
+    """The FakeChatLLM class, for tests that swap out pipeline.openai_llm."""
+    return FakeChatLLM
+
+
+@pytest.fixture
+def mock_deepseek():
+    """Build DeepSeekLLMs whose HTTP client sends requests to ``handler``.
+
+    The real pooled client is closed on creation (its auth headers are kept)
+    and the mock clients are closed at teardown.
+    """
+    import httpx
+
+    from app.pipeline import DeepSeekLLM
+
+    llms = []
+
+    def make(handler):
+        llm = DeepSeekLLM("test-key")
+        pooled = llm._client
+        llm._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler), headers=pooled.headers
+        )
+        asyncio.run(pooled.aclose())
+        llms.append(llm)
+        return llm
+
+    yield make
+    for llm in llms:
+        asyncio.run(llm.aclose())
@@ -53,3 +53,104 @@ def test_fastapi_app():
     routes = [r.path for r in app.routes]
     assert "/" in routes
     assert "/health" in routes
+
+
+def test_health_and_batch_validation():
+    """JSON endpoints respond; /generate-batch rejects a non-list body."""
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    client = TestClient(app)
+    health = client.get("/health")
+    assert health.status_code == 200
+    assert health.json()["status"] == "healthy"
+    assert set(health.json()["stage_cache"]) == {"hits", "misses"}
+    bad = client.post("/generate-batch", json={"topic": "x"})
+    assert bad.status_code == 400
+    not_objects = client.post("/generate-batch", json=[{"topic": "x"}, "y"])
+    assert not_objects.status_code == 400
+    too_many = client.post("/generate-batch", json=[{"topic": "x"}] * 1000)
+    assert too_many.status_code == 400
+
+
+def test_cancel_on_disconnect_cancels_work(monkeypatch):
+    """Pipeline work is cancelled once the client has disconnected."""
+    from types import SimpleNamespace
+
+    import pytest
+    from fastapi import HTTPException
+
+    from app import main
+
+    monkeypatch.setattr(main, "_DISCONNECT_POLL_SECONDS", 0.01)
+    cancelled = []
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def is_disconnected():
+        return True
+
+    request = SimpleNamespace(
+        is_disconnected=is_disconnected, url=SimpleNamespace(path="/generate")
+    )
+
+    async def run():
+        with pytest.raises(HTTPException) as exc:
+            await main._cancel_on_disconnect(request, slow())
+        await asyncio.sleep(0)
+        return exc.value.status_code
+
+    assert asyncio.run(run()) == 499
+    assert cancelled == [True]
+
+
+def test_regenerate_multi_chains_dependent_stages(monkeypatch):
+    """Draft and edit consume freshly regenerated upstream output."""
+    from fastapi.testclient import TestClient
+
+    from app import main
+
+    async def research_stage(topic, max_length=1000, refresh=False):
+        assert refresh
+        return {"status": "success", "research_data": "new research"}
+
+    async def draft_stage(topic, research_data, max_length=1200, refresh=False):
+        return {"status": "success", "draft_content": f"draft of {research_data}"}
+
+    async def edit_stage(topic, draft_content, max_length=1200, refresh=False):
+        return {"status": "success", "final_content": f"edited {draft_content}"}
+
+    monkeypatch.setattr(main.pipeline, "research_stage", research_stage)
+    monkeypatch.setattr(main.pipeline, "draft_stage", draft_stage)
+    monkeypatch.setattr(main.pipeline, "edit_stage", edit_stage)
+
+    client = TestClient(main.app)
+    res = client.post(
+        "/regenerate-multi",
+        json={"stages": ["research", "draft", "edit"], "topic": "t"},
+    )
+    assert res.status_code == 200
+    body = res.json()
+    assert body["final_stage"]["final_content"] == "edited draft of new research"
+
+    missing = client.post("/regenerate-multi", json={"stages": ["edit"], "topic": "t"})
+    assert missing.status_code == 400
+
+
+def test_startup_warmup_is_bounded(monkeypatch):
+    """A hung provider warm-up times out instead of blocking startup."""
+    from app import main
+
+    async def hang():
+        await asyncio.sleep(10)
+
+    monkeypatch.setattr(main, "PROVIDER_WARMUP", True)
+    monkeypatch.setattr(main, "PROVIDER_WARMUP_TIMEOUT", 0.01)
+    monkeypatch.setattr(main.app.state.pipeline, "warmup", hang)
+    asyncio.run(main._warmup())
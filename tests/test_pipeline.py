@@ -30,3 +30,796 @@ def test_parse_research_facts():
     assert len(facts) >= 2
     assert facts[0]["fact"] and facts[0]["source"]
     assert "IPCC" in facts[0]["source"] or "1.1" in facts[0]["fact"]
+
+
+def test_deepseek_reuses_pooled_client(mock_deepseek):
+    """DeepSeekLLM sends every request through one shared client."""
+    import asyncio
+
+    import httpx
+
+    calls = []
+    bodies = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.headers["Authorization"])
+        assert "gzip" in request.headers["Accept-Encoding"]
+        bodies.append(request.content)
+        return httpx.Response(
+            200, json={"choices": [{"message": {"content": "FACT: ok"}}]}
+        )
+
+    llm = mock_deepseek(handler)
+
+    async def run():
+        return await llm.agenerate("one"), await llm.agenerate("two")
+
+    assert asyncio.run(run()) == ("FACT: ok", "FACT: ok")
+    assert calls == ["Bearer test-key", "Bearer test-key"]
+    assert all(b'"stream":false' in b.replace(b" ", b"") for b in bodies)
+
+
+def test_run_pipeline_batch_preserves_order():
+    """Batch runs return one result per topic in input order."""
+    import asyncio
+
+    from app.pipeline import NewspaperPipeline
+
+    pipeline = NewspaperPipeline()
+
+    async def fake_run(topic, max_length=1000):
+        await asyncio.sleep(0.01 if topic == "slow" else 0)
+        if topic == "boom":
+            raise RuntimeError("boom")
+        return {"topic": topic, "max_length": max_length}
+
+    pipeline.run_pipeline = fake_run
+    results = asyncio.run(
+        pipeline.run_pipeline_batch([("slow", 100), ("fast", 200), ("boom", 300)])
+    )
+    assert results[0] == {"topic": "slow", "max_length": 100}
+    assert results[1] == {"topic": "fast", "max_length": 200}
+    assert isinstance(results[2], RuntimeError)
+
+
+def test_llm_cache_key_and_hits(monkeypatch):
+    """Identical deterministic requests are served from the cache."""
+    import asyncio
+
+    from app import pipeline as pipeline_module
+    from app.llm_cache import InMemoryLRU, cache_key, is_cacheable
+    from app.pipeline import NewspaperPipeline
+
+    messages = [{"role": "user", "content": "hi"}]
+    assert cache_key("m", messages, 0.0) == cache_key("m", list(messages), 0.0)
+    assert cache_key("m", messages, 0.0) != cache_key("m", messages, 0.5)
+    assert is_cacheable(0.0, None)
+    assert not is_cacheable(0.7, None)
+    assert is_cacheable(0.7, 42)
+
+    pipeline = NewspaperPipeline()
+    pipeline._llm_cache = InMemoryLRU()
+    calls = []
+
+    async def call():
+        calls.append(1)
+        return "text"
+
+    async def run():
+        first = await pipeline._cached_generate("openai", "m", messages, 0.0, call)
+        second = await pipeline._cached_generate("openai", "m", messages, 0.0, call)
+        return first, second
+
+    assert asyncio.run(run()) == ("text", "text")
+    assert len(calls) == 1
+
+    # LLM_SEED is only sent to OpenAI, so sampled Gemini output stays uncached.
+    monkeypatch.setattr(pipeline_module, "LLM_SEED", 42)
+    asyncio.run(pipeline._cached_generate("gemini", "m", messages, 0.5, call))
+    asyncio.run(pipeline._cached_generate("gemini", "m", messages, 0.5, call))
+    assert len(calls) == 3
+
+
+def test_truncate_to_word_count_sentence_boundary():
+    """Text over 120% of target is cut at the last whole sentence that fits."""
+    from app.pipeline import _truncate_to_word_count
+
+    short = "One two three. Four five."
+    assert _truncate_to_word_count(short, 5) == short
+    text = "One two three. Four five six. Seven eight nine ten."
+    assert _truncate_to_word_count(text, 6) == "One two three. Four five six."
+    assert _truncate_to_word_count("a b c d e f g h", 3) == "a b c"
+
+
+def test_stream_draft_stage_stops_early(fake_chat_llm):
+    """Draft streaming yields chunks and closes the stream once well over target."""
+    import asyncio
+
+    from app.pipeline import NewspaperPipeline
+
+    pipeline = NewspaperPipeline()
+    pipeline.openai_llm = fake_chat_llm(chunks=["word. "] * 1000, temperature=0.0)
+
+    async def collect():
+        return [e async for e in pipeline.stream_draft_stage("t", "r", 50)]
+
+    events = asyncio.run(collect())
+    assert events[0]["event"] == "draft_chunk"
+    final = events[-1]
+    assert final["event"] == "draft_stage"
+    assert final["data"]["status"] == "success"
+    assert final["data"]["word_count"] <= 50
+    assert pipeline.openai_llm.streamed < 100
+
+
+def test_fused_research_draft_splits_response(fake_chat_llm):
+    """The fused call yields research facts and a draft from one response."""
+    import asyncio
+
+    from app.pipeline import NewspaperPipeline
+
+    pipeline = NewspaperPipeline()
+    pipeline.openai_llm = fake_chat_llm(
+        replies=[
+            "FACT: Sea levels rise. | SOURCE: NASA\n"
+            "ARTICLE:\nOceans Climb. Sea levels are rising."
+        ],
+        temperature=0.0,
+    )
+    research, draft = asyncio.run(pipeline.fused_research_draft_stage("Seas", 100))
+    assert research["status"] == "success"
+    assert research["research_facts"] == [
+        {"fact": "Sea levels rise.", "source": "NASA"}
+    ]
+    assert draft["status"] == "success"
+    assert draft["draft_content"] == "Oceans Climb. Sea levels are rising."
+
+
+def test_word_count_fast_is_upper_bound():
+    """The fast estimate never undercounts whitespace-separated words."""
+    from app.pipeline import _count_words, _truncate_to_word_count, _word_count_fast
+
+    for text in (
+        "",
+        "one",
+        "one two",
+        "a  b\nc\td",
+        "line\n\nbreaks here ",
+        "cr\rvt\vff\fsep\x1fend",
+        "nbsp\xa0em\u2003ideographic\u3000line\u2028end",
+    ):
+        assert _word_count_fast(text) >= _count_words(text)
+    nbsp = ("word\xa0" * 300) + "end."
+    assert _count_words(_truncate_to_word_count(nbsp, 100)) == 100
+
+
+def test_deepseek_retries_transient_errors(monkeypatch, mock_deepseek):
+    """429/5xx responses are retried; the eventual success is returned."""
+    import asyncio
+
+    import httpx
+    from tenacity import wait_none
+
+    from app.pipeline import DeepSeekLLM
+
+    monkeypatch.setattr(DeepSeekLLM._post.retry, "wait", wait_none())
+    statuses = [503, 429, 200]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status = statuses.pop(0)
+        body = {"choices": [{"message": {"content": "done"}}]}
+        return httpx.Response(status, json=body if status == 200 else {})
+
+    llm = mock_deepseek(handler)
+    assert asyncio.run(llm.agenerate("prompt")) == "done"
+    assert statuses == []
+
+
+def test_research_max_tokens_scales_with_length(mock_deepseek):
+    """DeepSeek research max_tokens follows max_length, capped at 2000."""
+    import asyncio
+
+    import httpx
+    import orjson
+
+    from app.pipeline import research_max_tokens
+
+    assert research_max_tokens(50) == 300
+    assert research_max_tokens(500) == 700
+    assert research_max_tokens(5000) == 2000
+
+    sent = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(orjson.loads(request.content)["max_tokens"])
+        return httpx.Response(200, json={"choices": [{"message": {"content": "x"}}]})
+
+    llm = mock_deepseek(handler)
+    asyncio.run(llm.agenerate("prompt", research_max_tokens(500)))
+    assert sent == [700]
+
+
+def test_circuit_breaker_opens_and_recovers(monkeypatch):
+    """Breaker opens after repeated failures and half-opens after the timeout."""
+    from app import resilience
+
+    now = [100.0]
+    monkeypatch.setattr(resilience.time, "monotonic", lambda: now[0])
+    breaker = resilience.CircuitBreaker(
+        "test", failure_threshold=2, recovery_timeout=30
+    )
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert not breaker.allow()
+    now[0] += 31
+    assert breaker.state == resilience.CircuitBreaker.HALF_OPEN
+    assert [breaker.allow() for _ in range(3)] == [True, False, False]
+    breaker.release()
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == resilience.CircuitBreaker.CLOSED
+    assert breaker.allow() and breaker.allow()
+
+
+def test_parse_research_facts_fallback():
+    """Unformatted research is kept line by line with a default source."""
+    from app.pipeline import NewspaperPipeline
+
+    pipeline = NewspaperPipeline()
+    facts = pipeline._parse_research_facts("# Notes\nSea levels rise\n\nIce melts")
+    assert facts == [
+        {"fact": "Sea levels rise", "source": "DeepSeek Research"},
+        {"fact": "Ice melts", "source": "DeepSeek Research"},
+    ]
+    mixed = "Intro line\n- FACT: A | SOURCE: B\nFACT: C | SOURCE: D  "
+    assert pipeline._parse_research_facts(mixed) == [
+        {"fact": "A", "source": "B"},
+        {"fact": "C", "source": "D"},
+    ]
+
+
+def test_warmup_tolerates_provider_failures():
+    """Warm-up logs provider failures instead of raising."""
+    import asyncio
+
+    from app.pipeline import NewspaperPipeline
+
+    pipeline = NewspaperPipeline()
+    warmed = []
+
+    async def fake_warmup(provider):
+        if provider == "gemini":
+            raise RuntimeError("unreachable")
+        warmed.append(provider)
+
+    pipeline._warmup_provider = fake_warmup
+    asyncio.run(pipeline.warmup())
+    assert warmed == ["deepseek", "openai"]
+
+
+def test_draft_stage_multiple_drafts(monkeypatch, fake_chat_llm):
+    """n_drafts candidates are generated and returned alongside the first."""
+    import asyncio
+
+    from app import pipeline as pipeline_module
+    from app.pipeline import NewspaperPipeline
+
+    monkeypatch.setattr(pipeline_module, "LLM_SEED", 42)
+    pipeline = NewspaperPipeline()
+    pipeline.openai_llm = fake_chat_llm(replies=["First draft.", "Second draft."])
+    pipeline._llm_cache = None
+    pipeline._stage_cache = None
+    result = asyncio.run(pipeline.draft_stage("t", "r", 300, n_drafts=2))
+    assert [kwargs.get("seed") for kwargs in pipeline.openai_llm.bound] == [None, 43]
+    assert result["status"] == "success"
+    assert result["draft_content"] == "First draft."
+    assert [d["draft_content"] for d in result["drafts"]] == [
+        "First draft.",
+        "Second draft.",
+    ]
+
+
+def test_deepseek_client_reopens_after_close():
+    """A closed pooled client is replaced rather than failing later calls."""
+    import asyncio
+
+    from app.pipeline import DeepSeekLLM
+
+    llm = DeepSeekLLM("test-key")
+    first = llm._get_client()
+    asyncio.run(llm.aclose())
+    second = llm._get_client()
+    assert second is not first and not second.is_closed
+    assert second.headers["Authorization"] == "Bearer test-key"
+    asyncio.run(llm.aclose())
+
+
+def test_deepseek_aiohttp_backend_maps_errors(monkeypatch):
+    """The aiohttp path retries 5xx like httpx and returns the decoded body."""
+    import asyncio
+
+    from tenacity import wait_none
+
+    from app.pipeline import DeepSeekLLM
+
+    monkeypatch.setattr(DeepSeekLLM._post.retry, "wait", wait_none())
+    statuses = [502, 200]
+
+    class FakeResponse:
+        def __init__(self, status):
+            self.status = status
+            self.headers = {}
+
+        async def read(self):
+            return b'{"choices": [{"message": {"content": "via aiohttp"}}]}'
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+    class FakeSession:
+        closed = False
+
+        def post(self, url, data, headers):
+            assert headers["Content-Type"] == "application/json"
+            assert b'"model":"deepseek-chat"' in data
+            return FakeResponse(statuses.pop(0))
+
+        async def close(self):
+            self.closed = True
+
+    llm = DeepSeekLLM("test-key")
+    llm.backend = "aiohttp"
+    llm._session = FakeSession()
+    assert asyncio.run(llm.agenerate("prompt")) == "via aiohttp"
+    assert statuses == []
+    asyncio.run(llm.aclose())
+    assert llm._session.closed
+
+
+def test_stage_cache_hits_and_refresh(monkeypatch, fake_chat_llm):
+    """Identical stage inputs reuse the stored result unless refresh=True."""
+    import asyncio
+
+    from app import pipeline as pipeline_module
+    from app.llm_cache import InMemoryLRU, stage_cache_key
+    from app.pipeline import NewspaperPipeline
+
+    assert stage_cache_key("draft", "m", "1", {"a": 1}) != stage_cache_key(
+        "draft", "m", "2", {"a": 1}
+    )
+    monkeypatch.setattr(pipeline_module, "LLM_SEED", None)
+
+    pipeline = NewspaperPipeline()
+    pipeline.openai_llm = fake_chat_llm(
+        replies=["First draft.", "Second draft.", "Sampled.", "Resampled."],
+        temperature=0.0,
+    )
+    pipeline._llm_cache = None
+    pipeline._stage_cache = InMemoryLRU()
+
+    async def run():
+        first = await pipeline.draft_stage("t", "r", 300)
+        again = await pipeline.draft_stage("t", research_data="r", max_length=300)
+        fresh = await pipeline.draft_stage("t", "r", 300, refresh=True)
+        after = await pipeline.draft_stage("t", "r", 300)
+        return first, again, fresh, after
+
+    first, again, fresh, after = asyncio.run(run())
+    assert first["draft_content"] == again["draft_content"] == "First draft."
+    assert fresh["draft_content"] == after["draft_content"] == "Second draft."
+    assert pipeline.cache_stats == {"hits": 2, "misses": 2}
+
+    # Sampled output without a pinned seed is never reused.
+    pipeline.openai_llm.temperature = 0.7
+    sampled = asyncio.run(pipeline.draft_stage("t", "r", 300))
+    resampled = asyncio.run(pipeline.draft_stage("t", "r", 300))
+    assert sampled["draft_content"] == "Sampled."
+    assert resampled["draft_content"] == "Resampled."
+
+
+def test_refresh_bypasses_llm_cache(monkeypatch, fake_chat_llm):
+    """refresh=True regenerates even when the LLM response is cacheable."""
+    import asyncio
+
+    from app import pipeline as pipeline_module
+    from app.llm_cache import InMemoryLRU
+    from app.pipeline import NewspaperPipeline
+
+    monkeypatch.setattr(pipeline_module, "LLM_SEED", 42)
+    pipeline = NewspaperPipeline()
+    pipeline.openai_llm = fake_chat_llm(replies=["First draft.", "Second draft."])
+    pipeline._llm_cache = InMemoryLRU()
+    pipeline._stage_cache = None
+
+    async def run():
+        first = await pipeline.draft_stage("t", "r", 300)
+        fresh = await pipeline.draft_stage("t", "r", 300, refresh=True)
+        after = await pipeline.draft_stage("t", "r", 300)
+        return first, fresh, after
+
+    first, fresh, after = asyncio.run(run())
+    assert first["draft_content"] == "First draft."
+    assert fresh["draft_content"] == after["draft_content"] == "Second draft."
+
+
+def test_deepseek_astream_parses_sse(mock_deepseek):
+    """DeepSeek SSE deltas are yielded in order and [DONE] ends the stream."""
+    import asyncio
+
+    import httpx
+
+    sse = (
+        'data: {"choices": [{"delta": {"role": "assistant"}}]}\n\n'
+        'data: {"choices": [{"delta": {"content": "Fact "}}]}\n\n'
+        'data: {"choices": [{"delta": {"content": "one."}}]}\n\n'
+        "data: [DONE]\n\n"
+    )
+    sent = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request.content)
+        return httpx.Response(200, text=sse)
+
+    llm = mock_deepseek(handler)
+
+    async def collect():
+        return [text async for text in llm.astream("prompt")]
+
+    assert asyncio.run(collect()) == ["Fact ", "one."]
+    assert b'"stream":true' in sent[0].replace(b" ", b"")
+
+
+def test_stream_edit_stage_falls_back_on_404():
+    """A 404 from the primary Gemini model streams the edit from the fallback."""
+    import asyncio
+    from types import SimpleNamespace
+
+    from app.pipeline import NewspaperPipeline
+
+    class MissingModel:
+        temperature = 0.5
+
+        async def astream(self, messages, **kwargs):
+            raise ValueError("404 model not found")
+            yield  # pragma: no cover
+
+    class FallbackModel:
+        temperature = 0.5
+
+        async def astream(self, messages, **kwargs):
+            for text in ("Polished ", "article."):
+                yield SimpleNamespace(content=text)
+
+    pipeline = NewspaperPipeline()
+    pipeline.gemini_llm = MissingModel()
+    pipeline.gemini_fallback_llm = FallbackModel()
+
+    async def collect():
+        return [e async for e in pipeline.stream_edit_stage("t", "draft", 300)]
+
+    events = asyncio.run(collect())
+    assert [e["data"] for e in events if e["event"] == "final_chunk"] == [
+        "Polished ",
+        "article.",
+    ]
+    final = events[-1]
+    assert final["event"] == "final_stage"
+    assert final["data"]["status"] == "success"
+    assert final["data"]["final_content"] == "Polished article."
+    assert pipeline.gemini_edit_fallback_model in final["data"]["llm_used"]
+
+
+def test_overlapped_draft_edit_keeps_segment_order(fake_chat_llm):
+    """Segments are edited while the draft streams and rejoined in order."""
+    import asyncio
+    from types import SimpleNamespace
+
+    from app.pipeline import NewspaperPipeline
+
+    first = " ".join(["alpha"] * 160) + ".\n\n"
+    second = " ".join(["beta"] * 40) + "."
+
+    class FakeEditLLM:
+        temperature = 0.5
+
+        async def ainvoke(self, messages, **kwargs):
+            assert "do not add new ones" in messages[-1].content
+            if "alpha" in messages[-1].content:
+                await asyncio.sleep(0.05)
+                return SimpleNamespace(content="Edited alpha.")
+            return SimpleNamespace(content="Edited beta.")
+
+    pipeline = NewspaperPipeline()
+    pipeline.openai_llm = fake_chat_llm(chunks=[first, second])
+    pipeline.gemini_llm = FakeEditLLM()
+    draft, final = asyncio.run(
+        pipeline.overlapped_draft_edit_stage("t", "research", 400)
+    )
+    assert draft["status"] == "success"
+    assert final["status"] == "success"
+    assert final["final_content"] == "Edited alpha.\n\nEdited beta."
+
+
+def test_overlapped_draft_edit_handles_blank_draft(fake_chat_llm):
+    """A whitespace-only draft stream falls back to a normal edit."""
+    import asyncio
+    from types import SimpleNamespace
+
+    from app.pipeline import NewspaperPipeline
+
+    class FakeEditLLM:
+        temperature = 0.5
+
+        async def ainvoke(self, messages, **kwargs):
+            return SimpleNamespace(content="Nothing to edit.")
+
+    pipeline = NewspaperPipeline()
+    pipeline.openai_llm = fake_chat_llm(chunks=["   "])
+    pipeline.gemini_llm = FakeEditLLM()
+    draft, final = asyncio.run(
+        pipeline.overlapped_draft_edit_stage("t", "research", 400)
+    )
+    assert draft["status"] == "success"
+    assert final["status"] == "success"
+    assert final["final_content"] == "Nothing to edit."
+
+
+def test_pipelines_share_provider_clients(monkeypatch):
+    """Provider clients are built once per process, not per pipeline."""
+    import asyncio
+
+    from app import pipeline as pipeline_module
+    from app.config import Settings
+
+    keys = Settings("sk-test", "ds-test", "")
+    monkeypatch.setattr(pipeline_module, "settings", keys)
+    first = pipeline_module.NewspaperPipeline()
+    second = pipeline_module.NewspaperPipeline()
+    assert first.openai_llm is second.openai_llm
+    assert first.deepseek_llm is second.deepseek_llm
+    old_client = first._openai_http_client
+
+    asyncio.run(pipeline_module.aclose_shared_clients())
+    assert old_client.is_closed
+    third = pipeline_module.NewspaperPipeline()
+    assert third._openai_http_client is not old_client
+    assert not third._openai_http_client.is_closed
+    asyncio.run(pipeline_module.aclose_shared_clients())
+
+
+def test_retry_after_wait_is_capped():
+    """A long Retry-After is cut to RETRY_MAX_WAIT."""
+    import httpx
+    from tenacity import RetryCallState, Retrying
+
+    from app.resilience import RETRY_MAX_WAIT, wait_retry_after
+
+    request = httpx.Request("POST", "https://api.deepseek.com/v1/chat/completions")
+    response = httpx.Response(429, headers={"Retry-After": "600"}, request=request)
+    error = httpx.HTTPStatusError("429", request=request, response=response)
+    state = RetryCallState(Retrying(), fn=None, args=(), kwargs={})
+    state.set_exception((type(error), error, None))
+    assert wait_retry_after(state) == RETRY_MAX_WAIT
+
+
+def test_circuit_breaker_sliding_window(monkeypatch):
+    """Only failures inside the window count towards opening the breaker."""
+    from app import resilience
+
+    now = [100.0]
+    monkeypatch.setattr(resilience.time, "monotonic", lambda: now[0])
+    breaker = resilience.CircuitBreaker("test", failure_threshold=2, window=30)
+    breaker.record_failure()
+    now[0] += 31
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert not breaker.allow()
+
+
+def test_circuit_breaker_ignores_client_errors():
+    """Only retryable failures, direct or wrapped, count against the breaker."""
+    import asyncio
+
+    import httpx
+    import pytest
+
+    from app.pipeline import DeepSeekError
+    from app.resilience import CircuitBreaker
+
+    request = httpx.Request("POST", "https://api.deepseek.com/v1/chat/completions")
+    breaker = CircuitBreaker("test", failure_threshold=1)
+
+    def status_error(status):
+        response = httpx.Response(status, request=request)
+        return httpx.HTTPStatusError(str(status), request=request, response=response)
+
+    async def fail(exc):
+        raise exc
+
+    async def wrapped(exc):
+        raise DeepSeekError("DeepSeek API error") from exc
+
+    for bad in (status_error(400), ValueError("bad prompt")):
+        with pytest.raises(type(bad)):
+            asyncio.run(breaker.call(lambda: fail(bad)))
+    assert breaker.state == CircuitBreaker.CLOSED
+    with pytest.raises(DeepSeekError):
+        asyncio.run(breaker.call(lambda: wrapped(status_error(503))))
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_gemini_breaker_ignores_bad_requests():
+    """Request-specific Gemini errors do not route everyone to the fallback."""
+    import asyncio
+
+    from app.pipeline import NewspaperPipeline
+    from app.resilience import CircuitBreaker
+
+    class BadRequestLLM:
+        temperature = 0.5
+
+        async def ainvoke(self, messages, **kwargs):
+            raise ValueError("Invalid argument provided to Gemini")
+
+    pipeline = NewspaperPipeline()
+    pipeline.gemini_llm = BadRequestLLM()
+    pipeline._stage_cache = None
+    breaker = pipeline._breakers["gemini"]
+    for _ in range(breaker.failure_threshold):
+        result = asyncio.run(pipeline.edit_stage("t", "draft", 300))
+        assert result["status"] == "error"
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_open_breaker_short_circuits_draft(fake_chat_llm):
+    """An open OpenAI breaker fails the draft without calling the provider."""
+    import asyncio
+
+    from app.pipeline import NewspaperPipeline
+
+    pipeline = NewspaperPipeline()
+    pipeline.openai_llm = fake_chat_llm(
+        replies=[AssertionError("provider must not be called")]
+    )
+    pipeline._stage_cache = None
+    breaker = pipeline._breakers["openai"]
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+    result = asyncio.run(pipeline.draft_stage("t", "r", 300))
+    assert result["status"] == "error"
+    assert "circuit open" in result["message"]
+
+
+def test_pipeline_import_skips_provider_sdks():
+    """Importing the pipeline does not import the OpenAI or Google SDKs."""
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    code = (
+        "import sys, app.pipeline; "
+        "print(sorted(m for m in ('openai', 'google.api_core') if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parents[1],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert out.stdout.strip() == "[]"
+
+
+def test_is_retryable_covers_provider_sdks():
+    """OpenAI and Google API errors follow the same 429/5xx retry rule."""
+    import httpx
+    import openai
+    from google.api_core import exceptions as google_exceptions
+
+    from app.resilience import is_retryable
+
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    rate_limited = httpx.Response(429, request=request)
+    bad_request = httpx.Response(400, request=request)
+    assert is_retryable(openai.RateLimitError("x", response=rate_limited, body=None))
+    assert not is_retryable(
+        openai.BadRequestError("x", response=bad_request, body=None)
+    )
+    assert is_retryable(openai.APIConnectionError(request=request))
+    assert is_retryable(google_exceptions.ServiceUnavailable("x"))
+    assert not is_retryable(google_exceptions.NotFound("x"))
+
+
+def test_research_is_trimmed_before_drafting():
+    """Intro/outro chatter is dropped and long research is capped at a line."""
+    import asyncio
+
+    from app.pipeline import (
+        _strip_research_boilerplate,
+        _trim_research,
+        _truncate_for_model,
+    )
+
+    research = (
+        "Sure! Here is the research.\n"
+        "FACT: A | SOURCE: X\n"
+        "FACT: B | SOURCE: Y\n"
+        "Let me know if you need more."
+    )
+    assert _strip_research_boilerplate(research) == (
+        "FACT: A | SOURCE: X\nFACT: B | SOURCE: Y"
+    )
+    assert _strip_research_boilerplate("no facts here") == "no facts here"
+
+    lines = "\n".join(f"FACT: finding {i} | SOURCE: S" for i in range(100))
+    capped = _truncate_for_model(lines, "unknown-model", 50)
+    assert len(capped) <= 200
+    assert capped.endswith("| SOURCE: S")
+    assert _truncate_for_model("short", "unknown-model", 50) == "short"
+    assert asyncio.run(_trim_research(research, "unknown-model")) == (
+        "FACT: A | SOURCE: X\nFACT: B | SOURCE: Y"
+    )
+
+
+def test_truncate_for_model_allows_special_token_text(monkeypatch):
+    """Special-token strings in research are encoded as text, not rejected."""
+    from app import pipeline as pipeline_module
+
+    class FakeEncoding:
+        def encode(self, text, disallowed_special="all"):
+            if disallowed_special == "all" and "<|endoftext|>" in text:
+                raise ValueError("disallowed special token")
+            return list(text)
+
+        def decode(self, tokens):
+            return "".join(tokens)
+
+    monkeypatch.setattr(pipeline_module, "_token_encoding", lambda m: FakeEncoding())
+    text = "FACT: a <|endoftext|> b | SOURCE: X\n" * 10
+    capped = pipeline_module._truncate_for_model(text, "gpt-4-turbo-preview", 100)
+    assert capped and len(capped) <= 100
+
+
+def test_deepseek_errors_keep_their_cause(mock_deepseek):
+    """HTTP and malformed-body failures surface as chained DeepSeekError."""
+    import asyncio
+
+    import httpx
+    import pytest
+
+    from app.pipeline import DeepSeekError
+
+    responses = [httpx.Response(401, text="bad key"), httpx.Response(200, text="{}")]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return responses.pop(0)
+
+    llm = mock_deepseek(handler)
+    with pytest.raises(DeepSeekError, match="HTTP 401: bad key") as unauthorized:
+        asyncio.run(llm.agenerate("prompt"))
+    assert isinstance(unauthorized.value.__cause__, httpx.HTTPStatusError)
+    with pytest.raises(DeepSeekError, match="malformed response") as malformed:
+        asyncio.run(llm.agenerate("prompt"))
+    assert isinstance(malformed.value.__cause__, KeyError)
+
+
+def test_deepseek_warmup_gets_models(mock_deepseek):
+    """DeepSeek warm-up opens the pool with an authenticated GET /models."""
+    import asyncio
+
+    import httpx
+
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.method, request.url.path))
+        return httpx.Response(200, json={"data": []})
+
+    llm = mock_deepseek(handler)
+    asyncio.run(llm.warmup())
+    assert seen == [("GET", "/v1/models")]